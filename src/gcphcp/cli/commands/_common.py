@@ -0,0 +1,57 @@
+"""Helpers shared by the cluster and nodepool commands."""
+
+import re
+import weakref
+from typing import Any, Dict, Optional
+
+# ANSI sequences for redrawing watch output in place
+CURSOR_HOME = "\x1b[H"
+ERASE_DOWN = "\x1b[J"
+
+# Canonical 8-4-4-4-12 hex UUID, as used for cluster and nodepool IDs
+UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
+class ResolvedObjects:
+    """Objects fetched while resolving identifiers, kept for one reuse.
+
+    Entries are held per API client so that the command which asked for the
+    resolution can use the object instead of fetching it again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._objects: "weakref.WeakKeyDictionary[Any, Dict[str, Dict[str, Any]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def remember(self, api_client, object_id: str, obj: Dict[str, Any]) -> None:
+        """Keep an object fetched during resolution for the calling command.
+
+        Args:
+            api_client: API client instance
+            object_id: Resolved object ID
+            obj: Object data returned by the API
+        """
+        self._objects.setdefault(api_client, {})[object_id] = obj
+
+    def take(self, api_client, object_id: str) -> Optional[Dict[str, Any]]:
+        """Get the object fetched while resolving its identifier, if any.
+
+        The entry is consumed so that later reads go back to the API.
+
+        Args:
+            api_client: API client instance
+            object_id: Resolved object ID
+
+        Returns:
+            Object data, or None if it was not fetched during resolution
+        """
+        return self._objects.get(api_client, {}).pop(object_id, None)
+
+
+# Clusters and nodepools fetched while resolving identifiers
+resolved_clusters = ResolvedObjects()
+resolved_nodepools = ResolvedObjects()
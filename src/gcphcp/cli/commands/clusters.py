@@ -2,8 +2,20 @@
 
 import base64
 import json
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 import click
 from rich.panel import Panel
@@ -11,10 +23,40 @@ from rich.text import Text
 
 from ...client.exceptions import APIError, ResourceNotFoundError
 from ...constants import DEFAULT_REGION
+from ...utils.crypto import generate_cluster_keypair
+from ...utils.hypershift import (
+    HypershiftError,
+    create_iam_gcp,
+    create_infra_gcp,
+    iam_config_to_wif_spec,
+    validate_iam_config,
+    validate_infra_config,
+    validate_infra_id_length,
+)
+from ._common import CURSOR_HOME, ERASE_DOWN, UUID_RE, resolved_clusters
 
 if TYPE_CHECKING:
     from ..main import CLIContext
 
+# Section headings printed during cluster creation, styled once at import
+_STEP_GENERATE_KEYPAIR = Text("Step 1: Generate Keypair", style="bold cyan")
+_STEP_SETUP_IAM = Text("Step 2: Setup IAM Infrastructure", style="bold cyan")
+_STEP_SETUP_NETWORK = Text("Step 3: Setup Network Infrastructure", style="bold cyan")
+_HEADING_CREATING_CLUSTER = Text("Creating Cluster", style="bold cyan")
+_HEADING_CREATING_NODEPOOL = Text("Creating Default NodePool", style="bold cyan")
+
+# Cluster, nodepools, controller status and fetch warning for one status tick
+_StatusSnapshot = Tuple[
+    Dict[str, Any], List[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]
+]
+
+# Upper bound in seconds for the backed-off watch polling interval
+_WATCH_MAX_INTERVAL = 60
+
+# Shared read-only default for looking up missing nested objects in API
+# responses. Output structures get a fresh dict instead.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass
 class IAMConfigValues:
@@ -40,8 +82,6 @@ def extract_iam_config_values(
     Returns:
         IAMConfigValues with extracted values including wif_spec for cluster API
     """
-    from ...utils.hypershift import iam_config_to_wif_spec
-
     values = IAMConfigValues(
         project_id=iam_config.get("projectId"),
         infra_id=iam_config.get("infraId"),
@@ -158,23 +198,13 @@ def _setup_cluster_infra(
     Raises:
         click.ClickException: If any provisioning step fails
     """
-    from ...utils.hypershift import (
-        create_iam_gcp,
-        create_infra_gcp,
-        validate_iam_config,
-        validate_infra_config,
-        iam_config_to_wif_spec,
-        HypershiftError,
-    )
-    from ...utils.crypto import generate_cluster_keypair
-
     keypair_result = None
 
     try:
         # Step 1: Generate keypair
         if not cli_context.quiet:
             cli_context.console.print()
-            cli_context.console.print("[bold cyan]Step 1: Generate Keypair[/bold cyan]")
+            cli_context.console.print(_STEP_GENERATE_KEYPAIR)
 
         keypair_result = generate_cluster_keypair()
 
@@ -185,9 +215,7 @@ def _setup_cluster_infra(
         # Step 2: Setup IAM Infrastructure
         if not cli_context.quiet:
             cli_context.console.print()
-            cli_context.console.print(
-                "[bold cyan]Step 2: Setup IAM Infrastructure[/bold cyan]"
-            )
+            cli_context.console.print(_STEP_SETUP_IAM)
 
         iam_config = create_iam_gcp(
             infra_id=infra_id,
@@ -206,9 +234,7 @@ def _setup_cluster_infra(
         # Step 3: Setup Network Infrastructure
         if not cli_context.quiet:
             cli_context.console.print()
-            cli_context.console.print(
-                "[bold cyan]Step 3: Setup Network Infrastructure[/bold cyan]"
-            )
+            cli_context.console.print(_STEP_SETUP_NETWORK)
 
         infra_config = create_infra_gcp(
             infra_id=infra_id,
@@ -273,11 +299,6 @@ def _load_cluster_config(
     Raises:
         click.ClickException: If files cannot be read, parsed, or validated
     """
-    from ...utils.hypershift import (
-        validate_iam_config,
-        validate_infra_config,
-    )
-
     # =================================================================
     # Load and validate IAM config file (required)
     # =================================================================
@@ -357,11 +378,8 @@ def _load_cluster_config(
     # Read and encode signing key file
     # =================================================================
     try:
-        with open(signing_key_file, "r") as f:
-            signing_key_pem = f.read()
-        signing_key_base64 = base64.b64encode(signing_key_pem.encode("utf-8")).decode(
-            "utf-8"
-        )
+        with open(signing_key_file, "rb") as f:
+            signing_key_base64 = base64.b64encode(f.read()).decode("ascii")
     except Exception as e:
         raise click.ClickException(f"Failed to read signing key file: {e}")
 
@@ -431,6 +449,41 @@ def _build_cluster_spec(
     return cluster_data
 
 
+# Page size used when walking the full cluster list
+_CLUSTER_PAGE_SIZE = 100
+
+
+def _iter_cluster_pages(api_client) -> Iterator[List[Dict[str, Any]]]:
+    """Yield every page of the cluster list.
+
+    The list API only supports limit/offset paging. Paging stops once the
+    reported total has been fetched or, if the server omits it, when a page
+    comes back short.
+
+    Args:
+        api_client: API client instance
+
+    Yields:
+        Lists of cluster dicts, one per page
+    """
+    offset = 0
+    while True:
+        response = api_client.get(
+            "/api/v1/clusters",
+            params={"limit": _CLUSTER_PAGE_SIZE, "offset": offset},
+        )
+        clusters = response.get("clusters") or []
+        if clusters:
+            yield clusters
+        offset += len(clusters)
+
+        total = response.get("total")
+        if len(clusters) < _CLUSTER_PAGE_SIZE or (
+            total is not None and offset >= total
+        ):
+            return
+
+
 def resolve_cluster_identifier(api_client, identifier: str) -> str:
     """Resolve cluster identifier (name, partial ID, or full ID) to full cluster ID.
 
@@ -445,36 +498,41 @@ def resolve_cluster_identifier(api_client, identifier: str) -> str:
         click.ClickException: If no cluster found or multiple matches
     """
     # If it looks like a full UUID, try it directly first
-    if len(identifier) == 36 and identifier.count("-") == 4:
+    if UUID_RE.match(identifier):
         try:
-            # Test if it exists by fetching it
-            api_client.get(f"/api/v1/clusters/{identifier}")
+            # Test if it exists by fetching it. Only this detail response is
+            # kept for reuse; list entries may be partial summaries.
+            cluster = api_client.get(f"/api/v1/clusters/{identifier}")
+            resolved_clusters.remember(api_client, identifier, cluster)
             return identifier
         except ResourceNotFoundError:
             pass
 
     # Search through all clusters
     try:
-        response = api_client.get("/api/v1/clusters", params={"limit": 100})
-        clusters = response.get("clusters") or []
-
-        # Try exact name match first
-        for cluster in clusters:
-            if cluster.get("name") == identifier:
-                return cluster.get("id")
-
-        # Try partial ID match (case-insensitive)
+        # One pass over the pages collects names and partial ID matches
+        # (case-insensitive, lowercasing only the compared slice of each ID).
+        # Exact names win, so paging stops at the page that holds the name.
         identifier_lower = identifier.lower()
-        matches = []
-        for cluster in clusters:
-            cluster_id = cluster.get("id", "")
-            if cluster_id.lower().startswith(identifier_lower):
-                matches.append((cluster.get("id"), cluster.get("name")))
+        prefix_len = len(identifier_lower)
+        name_to_id: Dict[str, str] = {}
+        matches: List[Dict[str, Any]] = []
+        for page in _iter_cluster_pages(api_client):
+            for cluster in page:
+                cluster_id = cluster.get("id", "")
+                # Keep the first cluster listed under a name
+                name_to_id.setdefault(cluster.get("name", ""), cluster_id)
+                if cluster_id[:prefix_len].lower() == identifier_lower:
+                    matches.append(cluster)
+            if identifier in name_to_id:
+                return name_to_id[identifier]
 
         if len(matches) == 1:
-            return matches[0][0]  # Return the ID
+            return matches[0].get("id", "")
         elif len(matches) > 1:
-            match_list = "\n".join([f"  {id} ({name})" for id, name in matches])
+            match_list = "\n".join(
+                f"  {cluster.get('id')} ({cluster.get('name')})" for cluster in matches
+            )
             raise click.ClickException(
                 f"Multiple clusters match '{identifier}':\n{match_list}\n"
                 "Please provide a more specific identifier."
@@ -772,8 +830,11 @@ def _resolve_cluster_endpoint(
                                 )
                             return message
 
-            # Fallback: check if there's an api_endpoint field in cluster data
-            cluster = api_client.get(f"/api/v1/clusters/{cluster_id}")
+            # Fallback: check if there's an api_endpoint field in cluster data,
+            # reusing the cluster fetched during resolution when available
+            cluster = resolved_clusters.take(api_client, cluster_id) or api_client.get(
+                f"/api/v1/clusters/{cluster_id}"
+            )
             if cluster.get("api_endpoint"):
                 return cluster["api_endpoint"]
 
@@ -854,25 +915,23 @@ def list_clusters(
 
         # Format output
         if cli_context.output_format == "table":
-            # Prepare table data with full IDs
-            table_data = []
-            for cluster in clusters:
-                table_data.append(
-                    {
-                        "NAME": cluster.get("name", ""),
-                        "ID": cluster.get("id", ""),  # Show full ID
-                        "STATUS": cluster.get("status", {}).get("phase", "Unknown"),
-                        "PROJECT": cluster.get("target_project_id", ""),
-                        "CREATED": cli_context.formatter.format_datetime(
-                            cluster.get("created_at")
-                        ),
-                    }
+            # Prepare table rows with full IDs, in column order
+            fmt = cli_context.formatter.format_datetime
+            rows = [
+                (
+                    cluster.get("name", ""),
+                    cluster.get("id", ""),
+                    (cluster.get("status") or _EMPTY).get("phase", "Unknown"),
+                    cluster.get("target_project_id", ""),
+                    fmt(cluster.get("created_at")),
                 )
+                for cluster in clusters
+            ]
 
-            cli_context.formatter.print_table(
-                data=table_data,
-                title=f"Clusters ({len(clusters)}/{total})",
+            cli_context.formatter.print_table_rows(
+                rows,
                 columns=["NAME", "ID", "STATUS", "PROJECT", "CREATED"],
+                title=f"Clusters ({len(clusters)}/{total})",
             )
         else:
             # Use raw format for non-table outputs
@@ -907,7 +966,10 @@ def list_clusters(
     "--interval",
     default=5,
     type=int,
-    help="Polling interval in seconds for watch mode (default: 5)",
+    help=(
+        "Polling interval in seconds for watch mode (default: 5). Doubles while "
+        "the cluster status is unchanged and resets when it changes."
+    ),
 )
 @click.option(
     "--all",
@@ -939,9 +1001,6 @@ def cluster_status(
       gcphcp clusters status 3c7f2227 --watch --interval 3
       gcphcp clusters status demo08 --watch --all
     """
-    import time
-    from ...client.exceptions import ResourceNotFoundError, APIError
-
     # Resolve identifier once at the beginning
     try:
         api_client = cli_context.get_api_client()
@@ -949,66 +1008,42 @@ def cluster_status(
     except click.ClickException:
         raise
 
-    def print_status():
+    def fetch_status() -> _StatusSnapshot:
         try:
-            cluster = api_client.get(f"/api/v1/clusters/{cluster_id}")
+            # The GETs run one after another on the shared session, which is
+            # not thread-safe. In watch mode they are revalidated with the
+            # server's ETags, so unchanged ticks stay cheap.
+            # The first tick reuses the cluster fetched during resolution
+            cluster = resolved_clusters.take(api_client, cluster_id) or api_client.get(
+                f"/api/v1/clusters/{cluster_id}", conditional=watch
+            )
 
             # Fetch nodepools for this cluster
             nodepools: List[Dict[str, Any]] = []
             try:
-                nodepools_response = api_client.get(
-                    "/api/v1/nodepools", params={"clusterId": cluster_id}
+                nodepools_data = api_client.get(
+                    "/api/v1/nodepools",
+                    params={"clusterId": cluster_id},
+                    conditional=watch,
                 )
-                nodepools = nodepools_response.get("nodepools") or []
+                nodepools = nodepools_data.get("nodepools") or []
             except APIError:
                 # Don't fail if nodepools fetch fails - just show empty list
                 pass
 
             # Fetch additional controller status if --all flag is used
             controller_status_data = None
+            status_warning = None
             if all:
                 try:
                     controller_status_data = api_client.get(
-                        f"/api/v1/clusters/{cluster_id}/status"
+                        f"/api/v1/clusters/{cluster_id}/status", conditional=watch
                     )
                 except APIError as e:
-                    # If status endpoint is not available, show warning but continue
-                    if not cli_context.quiet:
-                        cli_context.console.print(
-                            f"[yellow]Warning: Could not fetch status: {e}[/yellow]"
-                        )
-
-            if cli_context.output_format == "table":
-                cli_context.formatter.print_cluster_status(
-                    cluster, cluster_id, nodepools=nodepools
-                )
+                    # If status endpoint is not available, warn but continue
+                    status_warning = f"Could not fetch status: {e}"
 
-                # Display additional controller status in table format
-                if all and controller_status_data:
-                    cli_context.formatter.print_controller_status(
-                        controller_status_data, cluster_id
-                    )
-            else:
-                # For JSON/YAML, show comprehensive data
-                status_data = {
-                    "cluster_id": cluster_id,
-                    "cluster_name": cluster.get("name", "Unknown"),
-                    "status": cluster.get("status", {}),
-                    "last_checked": time.strftime(
-                        "%Y-%m-%d %H:%M:%S UTC", time.gmtime()
-                    ),
-                }
-
-                # Include controller status data if --all is used
-                if all and controller_status_data:
-                    status_data["controller_status"] = controller_status_data.get(
-                        "controller_status", []
-                    )
-                    status_data["detailed_status"] = controller_status_data.get(
-                        "status", {}
-                    )
-
-                cli_context.formatter.print_data(status_data)
+            return cluster, nodepools, controller_status_data, status_warning
 
         except ResourceNotFoundError:
             cli_context.console.print(f"[red]Cluster '{cluster_id}' not found.[/red]")
@@ -1017,30 +1052,100 @@ def cluster_status(
             cli_context.console.print(f"[red]API error: {e}[/red]")
             raise click.ClickException(str(e))
 
+    def print_status(snapshot: _StatusSnapshot) -> None:
+        cluster, nodepools, controller_status_data, status_warning = snapshot
+
+        if status_warning and not cli_context.quiet:
+            cli_context.console.print(f"[yellow]Warning: {status_warning}[/yellow]")
+
+        if cli_context.output_format == "table":
+            cli_context.formatter.print_cluster_status(
+                cluster, cluster_id, nodepools=nodepools
+            )
+
+            # Display additional controller status in table format
+            if all and controller_status_data:
+                cli_context.formatter.print_controller_status(
+                    controller_status_data, cluster_id
+                )
+        else:
+            # For JSON/YAML, show comprehensive data
+            status_data = {
+                "cluster_id": cluster_id,
+                "cluster_name": cluster.get("name", "Unknown"),
+                "status": cluster.get("status") or {},
+                "last_checked": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
+            }
+
+            # Include controller status data if --all is used
+            if all and controller_status_data:
+                status_data["controller_status"] = controller_status_data.get(
+                    "controller_status", []
+                )
+                status_data["detailed_status"] = controller_status_data.get(
+                    "status", {}
+                )
+
+            cli_context.formatter.print_data(status_data)
+
     if watch:
         cli_context.console.print(
             "[cyan]Watching cluster status (press Ctrl+C to stop)...[/cyan]\n"
         )
+        # Back off while nothing changes so long-running phases don't keep
+        # polling at the base interval
+        delay = interval
+        max_delay = max(interval, _WATCH_MAX_INTERVAL)
+        last_state = None
+        last_snapshot = None
         try:
             while True:
+                snapshot = fetch_status()
+                cluster = snapshot[0]
+
                 if cli_context.output_format == "table":
-                    # Clear screen for table format
-                    cli_context.console.clear()
                     timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
-                    cli_context.console.print(f"[cyan]{timestamp}[/cyan]")
-
-                print_status()
+                    if snapshot == last_snapshot:
+                        # Nothing changed: only refresh the timestamp line
+                        if cli_context.console.is_terminal:
+                            cli_context.console.file.write(CURSOR_HOME)
+                            cli_context.console.print(f"[cyan]{timestamp}[/cyan]")
+                    else:
+                        # Redraw the table in place: clear the screen once,
+                        # then only move home and erase below on later ticks
+                        # so the terminal is not repainted from scratch
+                        if cli_context.console.is_terminal:
+                            if last_snapshot is None:
+                                cli_context.console.clear()
+                            else:
+                                cli_context.console.file.write(CURSOR_HOME + ERASE_DOWN)
+                        cli_context.console.print(f"[cyan]{timestamp}[/cyan]")
+                        print_status(snapshot)
+                else:
+                    print_status(snapshot)
+                last_snapshot = snapshot
+
+                status = cluster.get("status") or _EMPTY
+                state = (
+                    status.get("phase"),
+                    json.dumps(status.get("conditions"), sort_keys=True, default=str),
+                )
+                if state != last_state:
+                    delay = interval
+                    last_state = state
+                else:
+                    delay = min(delay * 2, max_delay)
 
                 if cli_context.output_format != "table":
                     cli_context.console.print(
-                        f"\n[dim]Next update in {interval} seconds...[/dim]"
+                        f"\n[dim]Next update in {delay} seconds...[/dim]"
                     )
 
-                time.sleep(interval)
+                time.sleep(delay)
         except KeyboardInterrupt:
             cli_context.console.print("\n[yellow]Status monitoring stopped.[/yellow]")
     else:
-        print_status()
+        print_status(fetch_status())
 
 
 @clusters_group.command("create")
@@ -1210,8 +1315,6 @@ def create_cluster(
         # =================================================================
         # Validate infra-id length for GCP resource constraints
         # =================================================================
-        from ...utils.hypershift import validate_infra_id_length
-
         try:
             validate_infra_id_length(effective_infra_id)
         except ValueError as e:
@@ -1328,7 +1431,7 @@ def create_cluster(
 
         if not cli_context.quiet:
             cli_context.console.print()
-            cli_context.console.print("[bold cyan]Creating Cluster[/bold cyan]")
+            cli_context.console.print(_HEADING_CREATING_CLUSTER)
 
         # =================================================================
         # Build final setup config with resolved values
@@ -1357,11 +1460,10 @@ def create_cluster(
 
         if dry_run:
             cli_context.console.print("[yellow]Dry run - would create:[/yellow]")
-            # Truncate signing key for display (it's very long)
-            import copy
-
-            display_data = copy.deepcopy(cluster_data)
-            spec = display_data.get("spec", {})
+            # Truncate signing key for display (it's very long). Only spec is
+            # modified, so shallow copies leave cluster_data untouched.
+            spec = dict(cluster_data.get("spec", {}))
+            display_data = {**cluster_data, "spec": spec}
             signing_key = spec.get("serviceAccountSigningKey", "")
             if signing_key and len(signing_key) > 20:
                 spec["serviceAccountSigningKey"] = signing_key[:20] + "..."
@@ -1391,9 +1493,7 @@ def create_cluster(
             try:
                 if not cli_context.quiet:
                     cli_context.console.print()
-                    cli_context.console.print(
-                        "[bold cyan]Creating Default NodePool[/bold cyan]"
-                    )
+                    cli_context.console.print(_HEADING_CREATING_NODEPOOL)
 
                 # Generate nodepool name
                 nodepool_name = f"{cluster_name}-nodepool-1"
@@ -1440,15 +1540,11 @@ def create_cluster(
                     )
 
         if not cli_context.quiet:
-            success_text = Text()
-            success_text.append(
-                "✓ Cluster created successfully!\n\n", style="green bold"
-            )
-            success_text.append(f"Name: {cluster.get('name')}\n", style="bright_blue")
-            success_text.append(f"ID: {cluster.get('id')}\n", style="dim")
-            success_text.append(
-                f"Status: {cluster.get('status', {}).get('phase', 'Unknown')}",
-                style="dim",
+            phase = (cluster.get("status") or _EMPTY).get("phase", "Unknown")
+            success_text = Text.assemble(
+                ("✓ Cluster created successfully!\n\n", "green bold"),
+                (f"Name: {cluster.get('name')}\n", "bright_blue"),
+                (f"ID: {cluster.get('id')}\nStatus: {phase}", "dim"),
             )
 
             panel = Panel(
@@ -1499,7 +1595,9 @@ def delete_cluster(
         # Resolve identifier and get cluster info for confirmation
         api_client = cli_context.get_api_client()
         cluster_id = resolve_cluster_identifier(api_client, cluster_identifier)
-        cluster = api_client.get(f"/api/v1/clusters/{cluster_id}")
+        cluster = resolved_clusters.take(api_client, cluster_id) or api_client.get(
+            f"/api/v1/clusters/{cluster_id}"
+        )
         cluster_name = cluster.get("name", cluster_id)
 
         # Confirm deletion
@@ -1,14 +1,81 @@
 """Infrastructure management commands for GCP HCP CLI."""
 
+import json
+import os
+
 import click
-from typing import TYPE_CHECKING
+from rich.console import Group
+from rich.text import Text
+from typing import Any, Dict, TYPE_CHECKING
 
 from ...constants import DEFAULT_REGION
+from ...utils.crypto import generate_cluster_keypair, signing_key_matches_jwks
+from ...utils.hypershift import (
+    SERVICE_ACCOUNTS,
+    HypershiftError,
+    create_iam_gcp,
+    create_infra_gcp,
+    destroy_iam_gcp,
+    destroy_infra_gcp,
+    validate_iam_config,
+    validate_infra_config,
+    validate_infra_id_length,
+)
 
 if TYPE_CHECKING:
     from ..main import CLIContext
 
 
+def _write_file_atomic(path: str, data: bytes, mode: int = 0o666) -> None:
+    """Write bytes to a file via a temporary sibling and an atomic rename.
+
+    The payload is written with a single write call, and an interrupted
+    write leaves any existing file untouched instead of a truncated one.
+
+    Args:
+        path: Destination file path
+        data: Serialized file contents
+        mode: Permission bits for the written file (before umask)
+    """
+    tmp_path = f"{path}.tmp"
+    # A leftover temp file from an interrupted run may have looser
+    # permissions; O_EXCL guarantees the file written here is new and
+    # created with the requested mode
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with os.fdopen(fd, "wb", buffering=0) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _serialize_config(config: Dict[str, Any], compact: bool = False) -> bytes:
+    """Serialize a config dict to JSON bytes for saving to disk.
+
+    Indented output is easier to read; compact output is smaller and goes
+    through the C encoder.
+
+    Args:
+        config: Configuration returned by hypershift
+        compact: Whether to omit indentation and spacing
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if compact:
+        return json.dumps(config, separators=(",", ":")).encode()
+    return json.dumps(config, indent=2).encode()
+
+
 @click.group("infra")
 def infra_group() -> None:
     """Manage infrastructure for hosted cluster deployments."""
@@ -56,6 +123,19 @@ def infra_group() -> None:
     type=click.Path(),
     help="Path for network infra config JSON (default: <infra-id>-infra-config.json)",
 )
+@click.option(
+    "--reuse-keys",
+    is_flag=True,
+    help=(
+        "Reuse the signing key and JWKS already at the output paths instead of "
+        "generating a new keypair"
+    ),
+)
+@click.option(
+    "--compact-json",
+    is_flag=True,
+    help="Write IAM and infra config files as compact, unindented JSON",
+)
 @click.pass_obj
 def create_infra(
     cli_context: "CLIContext",
@@ -68,6 +148,8 @@ def create_infra(
     output_jwks: str,
     output_iam_config: str,
     output_infra_config: str,
+    reuse_keys: bool,
+    compact_json: bool,
 ) -> None:
     """Create infrastructure for hosted cluster deployment.
 
@@ -106,19 +188,16 @@ def create_infra(
       # Create infrastructure with existing JWKS
       gcphcp infra create my-infra --project my-project \\
         --oidc-jwks-file ./existing-jwks.json
+
+      # Re-run with the keypair saved by a previous run
+      gcphcp infra create my-infra --project my-project --reuse-keys
+
+      # Write config files as compact JSON for other tools to consume
+      gcphcp infra create my-infra --project my-project --compact-json
     """
-    try:
-        from ...utils.hypershift import (
-            create_iam_gcp,
-            create_infra_gcp,
-            validate_iam_config,
-            validate_infra_config,
-            HypershiftError,
-        )
-        from ...utils.crypto import generate_cluster_keypair
-        import json
-        import shutil
+    keypair_result = None
 
+    try:
         # Use project from command line or config
         target_project = project or cli_context.config.get("default_project")
         if not target_project:
@@ -130,18 +209,60 @@ def create_infra(
         # =================================================================
         # Validate infra-id length for GCP resource constraints
         # =================================================================
-        from ...utils.hypershift import validate_infra_id_length
-
         try:
             validate_infra_id_length(infra_id)
         except ValueError as e:
             raise click.ClickException(str(e))
 
-        keypair_result = None
+        # Output paths, falling back to names derived from the infra-id
+        signing_key_path = output_signing_key or f"{infra_id}-signing-key.pem"
+        jwks_path = output_jwks or f"{infra_id}-jwks.json"
+        iam_config_path = output_iam_config or f"{infra_id}-iam-config.json"
+        infra_config_path = output_infra_config or f"{infra_id}-infra-config.json"
+
         jwks_file_to_use = oidc_jwks_file
 
+        # RSA key generation is the slowest local step, so repeated runs can
+        # pick up the keypair an earlier run saved
+        reuse_existing_keys = (
+            reuse_keys
+            and not oidc_jwks_file
+            and os.path.isfile(signing_key_path)
+            and os.path.isfile(jwks_path)
+        )
+
         # Step 1: Generate keypair if JWKS file not provided
-        if not oidc_jwks_file:
+        if reuse_existing_keys:
+            # The WIF pool trusts the JWKS, so it must publish the key the
+            # cluster will sign with
+            try:
+                with open(signing_key_path) as f:
+                    signing_key_pem = f.read()
+                with open(jwks_path) as f:
+                    existing_jwks = f.read()
+                keys_match = signing_key_matches_jwks(signing_key_pem, existing_jwks)
+            except (OSError, ValueError, TypeError) as e:
+                raise click.ClickException(
+                    f"Failed to read existing keypair {signing_key_path}: {e}"
+                )
+            if not keys_match:
+                raise click.ClickException(
+                    f"JWKS {jwks_path} does not contain the public key of "
+                    f"{signing_key_path}. Remove both files or run without "
+                    "--reuse-keys to generate a new keypair."
+                )
+
+            jwks_file_to_use = jwks_path
+            if not cli_context.quiet:
+                cli_context.console.print()
+                cli_context.console.print(
+                    "[bold cyan]Step 1: Generate Keypair[/bold cyan]"
+                )
+                cli_context.console.print(
+                    f"[green]✓[/green] Reusing existing keypair: "
+                    f"{signing_key_path}, {jwks_path}"
+                )
+        elif not oidc_jwks_file:
             if not cli_context.quiet:
                 cli_context.console.print()
                 cli_context.console.print(
@@ -149,8 +270,9 @@ def create_infra(
                 )
 
             try:
-                keypair_result = generate_cluster_keypair()
-                jwks_file_to_use = keypair_result.jwks_file_path
+                # The JWKS is saved straight from memory, so no temporary
+                # copy is needed
+                keypair_result = generate_cluster_keypair(write_jwks_file=False)
 
                 if not cli_context.quiet:
                     cli_context.console.print(
@@ -158,18 +280,21 @@ def create_infra(
                     )
                     cli_context.console.print(f"[dim]  kid: {keypair_result.kid}[/dim]")
 
-                # Save signing key (use default filename if not specified)
-                signing_key_path = output_signing_key or f"{infra_id}-signing-key.pem"
-                with open(signing_key_path, "w") as f:
-                    f.write(keypair_result.private_key_pem)
+                # Save signing key, readable by the owner only since it is a
+                # private key
+                _write_file_atomic(
+                    signing_key_path,
+                    keypair_result.private_key_pem.encode("ascii"),
+                    mode=0o600,
+                )
                 if not cli_context.quiet:
                     cli_context.console.print(
                         f"[green]✓[/green] Signing key saved to: {signing_key_path}"
                     )
 
-                # Save JWKS (use default filename if not specified)
-                jwks_path = output_jwks or f"{infra_id}-jwks.json"
-                shutil.copy(keypair_result.jwks_file_path, jwks_path)
+                # Save JWKS and point hypershift at the saved file
+                _write_file_atomic(jwks_path, keypair_result.jwks_json.encode())
+                jwks_file_to_use = jwks_path
                 if not cli_context.quiet:
                     cli_context.console.print(
                         f"[green]✓[/green] JWKS saved to: {jwks_path}"
@@ -186,7 +311,6 @@ def create_infra(
             )
 
         try:
-            # Run hypershift create iam gcp
             iam_config = create_iam_gcp(
                 infra_id=infra_id,
                 project_id=target_project,
@@ -201,10 +325,9 @@ def create_infra(
                     "Invalid IAM configuration returned from hypershift"
                 )
 
-            # Save IAM config (use default filename if not specified)
-            iam_config_path = output_iam_config or f"{infra_id}-iam-config.json"
-            with open(iam_config_path, "w") as f:
-                json.dump(iam_config, f, indent=2)
+            # Save IAM config
+            iam_json = _serialize_config(iam_config, compact_json)
+            _write_file_atomic(iam_config_path, iam_json)
             if not cli_context.quiet:
                 cli_context.console.print(
                     f"[green]✓[/green] IAM configuration saved to: {iam_config_path}"
@@ -214,7 +337,8 @@ def create_infra(
             cli_context.console.print(f"[red]Failed to setup IAM: {e}[/red]")
             raise click.ClickException(str(e))
 
-        # Step 3: Setup Network Infrastructure
+        # Step 3: Setup Network Infrastructure, only once IAM setup succeeded
+        # so a failed run leaves no network resources behind
         if not cli_context.quiet:
             cli_context.console.print()
             cli_context.console.print(
@@ -222,7 +346,6 @@ def create_infra(
             )
 
         try:
-            # Run hypershift create infra gcp
             infra_config = create_infra_gcp(
                 infra_id=infra_id,
                 project_id=target_project,
@@ -238,10 +361,9 @@ def create_infra(
                     "Invalid infrastructure configuration returned from hypershift"
                 )
 
-            # Save infra config (use default filename if not specified)
-            infra_config_path = output_infra_config or f"{infra_id}-infra-config.json"
-            with open(infra_config_path, "w") as f:
-                json.dump(infra_config, f, indent=2)
+            # Save infra config
+            infra_json = _serialize_config(infra_config, compact_json)
+            _write_file_atomic(infra_config_path, infra_json)
             if not cli_context.quiet:
                 cli_context.console.print(
                     f"[green]✓[/green] Infra config saved to: {infra_config_path}"
@@ -264,15 +386,25 @@ def create_infra(
             cli_context.console.print("[bold]Network Configuration:[/bold]")
             cli_context.console.print_json(data=infra_config)
 
+            # One print for the whole list; Text also keeps brackets in the
+            # paths from being read as markup
+            saved_files = []
+            if keypair_result or reuse_existing_keys:
+                saved_files += [
+                    ("Signing key", signing_key_path),
+                    ("JWKS", jwks_path),
+                ]
+            saved_files += [
+                ("IAM config", iam_config_path),
+                ("Infra config", infra_config_path),
+            ]
             cli_context.console.print()
-            cli_context.console.print("[bold]Saved Files:[/bold]")
-            if keypair_result:
-                signing_key_path = output_signing_key or f"{infra_id}-signing-key.pem"
-                jwks_path = output_jwks or f"{infra_id}-jwks.json"
-                cli_context.console.print(f"  • Signing key: {signing_key_path}")
-                cli_context.console.print(f"  • JWKS: {jwks_path}")
-            cli_context.console.print(f"  • IAM config: {iam_config_path}")
-            cli_context.console.print(f"  • Infra config: {infra_config_path}")
+            cli_context.console.print(
+                Group(
+                    Text("Saved Files:", style="bold"),
+                    *(Text(f"  • {label}: {path}") for label, path in saved_files),
+                )
+            )
         else:
             # Output combined config in quiet mode
             combined_config = {
@@ -281,17 +413,11 @@ def create_infra(
             }
             cli_context.formatter.print_data(combined_config)
 
-        # Clean up temporary JWKS file
-        if keypair_result:
-            keypair_result.cleanup()
-
     except click.ClickException:
         raise
     except Exception as e:
         cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        import sys
-
-        sys.exit(1)
+        raise click.ClickException(str(e)) from e
 
 
 @infra_group.command("destroy")
@@ -340,13 +466,6 @@ def destroy_infra(
       gcphcp infra destroy my-infra --project my-project --region us-central1 --yes
     """
     try:
-        from ...utils.hypershift import (
-            destroy_iam_gcp,
-            destroy_infra_gcp,
-            HypershiftError,
-            SERVICE_ACCOUNTS,
-        )
-
         # Use project from command line or config
         target_project = project or cli_context.config.get("default_project")
         if not target_project:
@@ -456,6 +575,4 @@ def destroy_infra(
         raise
     except Exception as e:
         cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        import sys
-
-        sys.exit(1)
+        raise click.ClickException(str(e)) from e
@@ -1,18 +1,86 @@
 """NodePool management commands for GCP HCP CLI."""
 
+import functools
+import re
 import time
-from typing import Any, Dict, Optional, Union, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    TYPE_CHECKING,
+)
 
 import click
 from rich.panel import Panel
 
 from ...client.exceptions import APIError, ResourceNotFoundError, ValidationError
-from ...models.nodepool import NodePool
+from ._common import (
+    CURSOR_HOME,
+    ERASE_DOWN,
+    UUID_RE,
+    resolved_clusters,
+    resolved_nodepools,
+)
+from .clusters import resolve_cluster_identifier
 
 if TYPE_CHECKING:
     from ..main import CLIContext
 
 
+# Command callback wrapped by _cli_error_handler
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# key=value labels, split at the first "="
+_LABEL_RE = re.compile(r"([^=]*)=(.*)", re.DOTALL)
+
+# key=value:effect taints, split at the first "=" and the last ":"
+_TAINT_RE = re.compile(r"([^=]*)=(.*):([^:]*)", re.DOTALL)
+
+# Page size used when scanning the nodepool list
+_NODEPOOL_PAGE_SIZE = 100
+
+
+def _iter_nodepools(
+    api_client, cluster_id: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield every nodepool, fetching the list one page at a time.
+
+    Paging stops once the reported total has been fetched or, if the server
+    omits it, when a page comes back short.
+
+    Args:
+        api_client: API client instance
+        cluster_id: Optional cluster ID to narrow the listing
+
+    Yields:
+        Nodepool dicts
+    """
+    params: Dict[str, Union[int, str]] = {"limit": _NODEPOOL_PAGE_SIZE, "offset": 0}
+    if cluster_id:
+        params["clusterId"] = cluster_id
+
+    offset = 0
+    while True:
+        response = api_client.get("/api/v1/nodepools", params=dict(params))
+        nodepools = response.get("nodepools") or ()
+        yield from nodepools
+        offset += len(nodepools)
+
+        total = response.get("total")
+        if len(nodepools) < _NODEPOOL_PAGE_SIZE or (
+            total is not None and offset >= total
+        ):
+            return
+        params["offset"] = offset
+
+
 def resolve_nodepool_identifier(
     api_client, identifier: str, cluster_id: Optional[str] = None
 ) -> str:
@@ -30,27 +98,23 @@ def resolve_nodepool_identifier(
         click.ClickException: If no nodepool found or multiple matches
     """
     # If it looks like a full UUID, try it directly first
-    if len(identifier) == 36 and identifier.count("-") == 4:
+    if UUID_RE.match(identifier):
         try:
-            # Test if it exists by fetching it
-            api_client.get(f"/api/v1/nodepools/{identifier}")
+            # Test if it exists by fetching it. Only this detail response is
+            # kept for reuse; list entries may be partial summaries.
+            nodepool = api_client.get(f"/api/v1/nodepools/{identifier}")
+            resolved_nodepools.remember(api_client, identifier, nodepool)
             return identifier
         except ResourceNotFoundError:
             pass
 
-    # Build search params
-    params: Dict[str, Union[int, str]] = {"limit": 100}
-    if cluster_id:
-        params["clusterId"] = cluster_id
-
-    # Search through nodepools
+    # Search through every page of nodepools, collecting name and partial ID
+    # matches in a single pass
     try:
-        response = api_client.get("/api/v1/nodepools", params=params)
-        nodepools = response.get("nodepools") or []
-
-        # Try exact name match first
-        name_matches = []
-        for nodepool in nodepools:
+        identifier_lower = identifier.lower() if len(identifier) >= 8 else None
+        name_matches: List[tuple] = []
+        matches: List[tuple] = []
+        for nodepool in _iter_nodepools(api_client, cluster_id):
             if nodepool.get("name") == identifier:
                 name_matches.append(
                     (
@@ -59,7 +123,13 @@ def resolve_nodepool_identifier(
                         nodepool.get("cluster_id") or nodepool.get("clusterId"),
                     )
                 )
+            # Partial ID match (case-insensitive, minimum 8 chars)
+            if identifier_lower and (
+                nodepool.get("id", "").lower().startswith(identifier_lower)
+            ):
+                matches.append((nodepool.get("id"), nodepool.get("name")))
 
+        # Exact name matches take precedence over partial IDs
         if len(name_matches) == 1:
             return name_matches[0][0]  # Return the ID
         elif len(name_matches) > 1:
@@ -80,23 +150,14 @@ def resolve_nodepool_identifier(
                 f"gcphcp nodepools <command> {identifier} --cluster <cluster-name>"
             )
 
-        # Try partial ID match (case-insensitive, minimum 8 chars)
-        if len(identifier) >= 8:
-            identifier_lower = identifier.lower()
-            matches = []
-            for nodepool in nodepools:
-                nodepool_id = nodepool.get("id", "")
-                if nodepool_id.lower().startswith(identifier_lower):
-                    matches.append((nodepool.get("id"), nodepool.get("name")))
-
-            if len(matches) == 1:
-                return matches[0][0]  # Return the ID
-            elif len(matches) > 1:
-                match_list = "\n".join([f"  {id} ({name})" for id, name in matches])
-                raise click.ClickException(
-                    f"Multiple nodepools match '{identifier}':\n{match_list}\n"
-                    "Please provide a more specific identifier."
-                )
+        if len(matches) == 1:
+            return matches[0][0]  # Return the ID
+        elif len(matches) > 1:
+            match_list = "\n".join([f"  {id} ({name})" for id, name in matches])
+            raise click.ClickException(
+                f"Multiple nodepools match '{identifier}':\n{match_list}\n"
+                "Please provide a more specific identifier."
+            )
 
         # No matches found
         raise click.ClickException(
@@ -123,11 +184,12 @@ def parse_labels(labels_tuple: tuple) -> Dict[str, str]:
     """
     labels = {}
     for label in labels_tuple:
-        if "=" not in label:
+        match = _LABEL_RE.fullmatch(label)
+        if not match:
             raise click.ClickException(
                 f"Invalid label format '{label}'. Expected 'key=value'."
             )
-        key, value = label.split("=", 1)
+        key, value = match.groups()
         labels[key.strip()] = value.strip()
     return labels
 
@@ -146,22 +208,53 @@ def parse_taints(taints_tuple: tuple) -> list:
     """
     taints = []
     for taint in taints_tuple:
-        if "=" not in taint or ":" not in taint:
-            raise click.ClickException(
-                f"Invalid taint format '{taint}'. Expected 'key=value:effect'."
-            )
-        key_value, effect = taint.rsplit(":", 1)
-        if "=" not in key_value:
+        match = _TAINT_RE.fullmatch(taint)
+        if not match:
             raise click.ClickException(
                 f"Invalid taint format '{taint}'. Expected 'key=value:effect'."
             )
-        key, value = key_value.split("=", 1)
+        key, value, effect = match.groups()
         taints.append(
             {"key": key.strip(), "value": value.strip(), "effect": effect.strip()}
         )
     return taints
 
 
+def _cli_error_handler(report_validation: bool = False) -> Callable[[_F], _F]:
+    """Report API and unexpected errors from a command as Click errors.
+
+    Args:
+        report_validation: Report request validation failures as validation
+            errors rather than generic API errors
+
+    Returns:
+        Decorator for a command callback taking the CLI context as first
+        argument
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(cli_context: "CLIContext", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(cli_context, *args, **kwargs)
+            except click.ClickException:
+                raise
+            except ValidationError as e:
+                label = "Validation error" if report_validation else "API error"
+                cli_context.console.print(f"[red]{label}: {e}[/red]")
+                raise click.ClickException(str(e))
+            except APIError as e:
+                cli_context.console.print(f"[red]API error: {e}[/red]")
+                raise click.ClickException(str(e))
+            except Exception as e:
+                cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
+                raise click.ClickException(str(e))
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
 @click.group("nodepools")
 def nodepools_group() -> None:
     """Manage nodepools for clusters."""
@@ -183,6 +276,7 @@ def nodepools_group() -> None:
     help="Maximum number of nodepools to list (default: 50)",
 )
 @click.pass_obj
+@_cli_error_handler()
 def list_nodepools(
     cli_context: "CLIContext", cluster: Optional[str], limit: int
 ) -> None:
@@ -198,113 +292,101 @@ def list_nodepools(
         gcphcp nodepools list --cluster 3c7f2227
         gcphcp nodepools list --cluster my-cluster --limit 100
     """
-    from .clusters import resolve_cluster_identifier
-
-    try:
-        api_client = cli_context.get_api_client()
+    api_client = cli_context.get_api_client()
 
-        # Build query parameters
-        params: Dict[str, Union[int, str]] = {"limit": limit}
-
-        # Resolve cluster identifier to UUID if provided
-        if cluster:
-            cluster_id = resolve_cluster_identifier(api_client, cluster)
-            params["clusterId"] = cluster_id
-
-        # Fetch nodepools
-        response = api_client.get("/api/v1/nodepools", params=params)
-        nodepools_data = response.get("nodepools") or []
-
-        # Handle empty list
-        if not nodepools_data:
-            if not cli_context.quiet:
-                if cluster:
-                    cli_context.console.print(
-                        f"[yellow]No nodepools found for cluster {cluster}[/yellow]"
-                    )
-                    cli_context.console.print(
-                        f"[dim]Create one with:[/dim] gcphcp nodepools create <name> "
-                        f"--cluster {cluster} --replicas <N>"
-                    )
-                else:
-                    cli_context.console.print("[yellow]No nodepools found[/yellow]")
-                    cli_context.console.print(
-                        "[dim]Create one with:[/dim] gcphcp nodepools create <name> "
-                        "--cluster <cluster-id> --replicas <N>"
-                    )
-            return
+    # Build query parameters
+    params: Dict[str, Union[int, str]] = {"limit": limit}
 
-        # Handle non-table formats
-        if cli_context.output_format != "table":
-            cli_context.formatter.print_data({"nodepools": nodepools_data})
-            return
+    # Resolve cluster identifier to UUID if provided
+    if cluster:
+        cluster_id = resolve_cluster_identifier(api_client, cluster)
+        params["clusterId"] = cluster_id
 
-        # Collect unique cluster IDs to fetch cluster information
-        unique_cluster_ids = set()
-        for np_data in nodepools_data:
-            cluster_id = np_data.get("cluster_id") or np_data.get("clusterId")
-            if cluster_id:
-                unique_cluster_ids.add(cluster_id)
+    # Fetch nodepools
+    response = api_client.get("/api/v1/nodepools", params=params)
+    nodepools_data = response.get("nodepools") or ()
 
-        # Fetch cluster information for all unique cluster IDs
-        cluster_info_map = {}
-        for cluster_id in unique_cluster_ids:
-            try:
-                cluster_data = api_client.get(f"/api/v1/clusters/{cluster_id}")
-                cluster_info_map[cluster_id] = {
-                    "name": cluster_data.get("name", ""),
-                    "project": cluster_data.get("target_project_id")
-                    or cluster_data.get("targetProjectId")
-                    or "",
-                }
-            except Exception:
-                # If we can't fetch cluster info, use defaults
-                cluster_info_map[cluster_id] = {
-                    "name": cluster_id[:8],
-                    "project": "",
-                }
-
-        # Prepare table data
-        table_data = []
+    # Handle empty list
+    if not nodepools_data:
+        if not cli_context.quiet:
+            if cluster:
+                cli_context.console.print(
+                    f"[yellow]No nodepools found for cluster {cluster}[/yellow]"
+                )
+                cli_context.console.print(
+                    f"[dim]Create one with:[/dim] gcphcp nodepools create <name> "
+                    f"--cluster {cluster} --replicas <N>"
+                )
+            else:
+                cli_context.console.print("[yellow]No nodepools found[/yellow]")
+                cli_context.console.print(
+                    "[dim]Create one with:[/dim] gcphcp nodepools create <name> "
+                    "--cluster <cluster-id> --replicas <N>"
+                )
+        return
+
+    # Handle non-table formats
+    if cli_context.output_format != "table":
+        cli_context.formatter.print_data({"nodepools": nodepools_data})
+        return
+
+    # Collect unique cluster IDs to fetch cluster information
+    unique_cluster_ids = set()
+    for np_data in nodepools_data:
+        cluster_id = np_data.get("cluster_id") or np_data.get("clusterId")
+        if cluster_id:
+            unique_cluster_ids.add(cluster_id)
+
+    # Fetch cluster information for all unique cluster IDs
+    cluster_info_map = {}
+    for cluster_id in unique_cluster_ids:
+        try:
+            # The --cluster lookup may already have fetched this cluster
+            cluster_data = resolved_clusters.take(
+                api_client, cluster_id
+            ) or api_client.get(f"/api/v1/clusters/{cluster_id}")
+            cluster_info_map[cluster_id] = {
+                "name": cluster_data.get("name", ""),
+                "project": cluster_data.get("target_project_id")
+                or cluster_data.get("targetProjectId")
+                or "",
+            }
+        except Exception:
+            # If we can't fetch cluster info, use defaults
+            cluster_info_map[cluster_id] = {
+                "name": cluster_id[:8],
+                "project": "",
+            }
+
+    # Rows are produced while the table is built, in column order,
+    # straight from the API dicts: the table only needs a few display
+    # fields, not a fully parsed NodePool model per row
+    def table_rows() -> Iterator[Tuple[str, ...]]:
+        no_cluster_info = {"name": "", "project": ""}
+        format_datetime = cli_context.formatter.format_datetime
         for np_data in nodepools_data:
-            nodepool = NodePool.from_api_response(np_data)
-
-            # Get cluster info
             cluster_info = cluster_info_map.get(
-                nodepool.clusterId, {"name": "", "project": ""}
+                np_data.get("cluster_id") or np_data.get("clusterId"),
+                no_cluster_info,
             )
-
-            table_data.append(
-                {
-                    "NAME": nodepool.name,
-                    "ID": nodepool.id,
-                    "STATUS": nodepool.get_display_status(),
-                    "CLUSTER": cluster_info["name"],
-                    "PROJECT": cluster_info["project"],
-                    "CREATED": cli_context.formatter.format_datetime(
-                        nodepool.createdAt.isoformat() if nodepool.createdAt else None
-                    ),
-                }
+            yield (
+                np_data.get("name", ""),
+                np_data.get("id", ""),
+                (np_data.get("status") or {}).get("phase") or "Unknown",
+                cluster_info["name"],
+                cluster_info["project"],
+                format_datetime(np_data.get("created_at") or np_data.get("createdAt")),
             )
 
-        # Create table title
-        table_title = f"NodePools for cluster {cluster}" if cluster else "All NodePools"
-
-        # Print table using formatter
-        cli_context.formatter.print_table(
-            data=table_data,
-            title=table_title,
-            columns=["NAME", "ID", "STATUS", "CLUSTER", "PROJECT", "CREATED"],
-        )
+    # Create table title
+    table_title = f"NodePools for cluster {cluster}" if cluster else "All NodePools"
 
-    except click.ClickException:
-        raise
-    except APIError as e:
-        cli_context.console.print(f"[red]API error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except Exception as e:
-        cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        raise click.ClickException(str(e))
+    # Print table using formatter
+    cli_context.formatter.print_table_rows(
+        table_rows(),
+        columns=["NAME", "ID", "STATUS", "CLUSTER", "PROJECT", "CREATED"],
+        title=table_title,
+    )
 
 
 @nodepools_group.command("create")
@@ -348,6 +430,7 @@ def list_nodepools(
     help="Node taints in key=value:effect format (can be specified multiple times)",
 )
 @click.pass_obj
+@_cli_error_handler(report_validation=True)
 def create_nodepool(
     cli_context: "CLIContext",
     nodepool_name: str,
@@ -372,83 +455,68 @@ def create_nodepool(
         gcphcp nodepools create workers --cluster demo08 --replicas 3 \\
             --labels env=prod --labels team=platform
     """
-    from .clusters import resolve_cluster_identifier
-
-    try:
-        api_client = cli_context.get_api_client()
-
-        # Validate inputs
-        if replicas <= 0:
-            raise click.ClickException("Replicas must be greater than 0")
-
-        # Resolve cluster identifier to UUID
-        cluster_id = resolve_cluster_identifier(api_client, cluster)
-
-        # Parse labels and taints
-        parsed_labels = parse_labels(labels) if labels else {}
-        parsed_taints = parse_taints(taints) if taints else []
-
-        # Build nodepool spec
-        nodepool_data: Dict[str, Any] = {
-            "name": nodepool_name,
-            "cluster_id": cluster_id,
-            "spec": {
-                "replicas": replicas,
-                "platform": {
-                    "type": "GCP",
-                    "gcp": {
-                        "instanceType": instance_type,
-                        "rootVolume": {"size": disk_size, "type": disk_type},
-                    },
+    api_client = cli_context.get_api_client()
+
+    # Validate inputs
+    if replicas <= 0:
+        raise click.ClickException("Replicas must be greater than 0")
+
+    # Resolve cluster identifier to UUID
+    cluster_id = resolve_cluster_identifier(api_client, cluster)
+
+    # Parse labels and taints
+    parsed_labels = parse_labels(labels) if labels else {}
+    parsed_taints = parse_taints(taints) if taints else []
+
+    # Build nodepool spec
+    nodepool_data: Dict[str, Any] = {
+        "name": nodepool_name,
+        "cluster_id": cluster_id,
+        "spec": {
+            "replicas": replicas,
+            "platform": {
+                "type": "GCP",
+                "gcp": {
+                    "instanceType": instance_type,
+                    "rootVolume": {"size": disk_size, "type": disk_type},
                 },
-                "management": {"autoRepair": auto_repair, "upgradeType": "Replace"},
             },
-        }
-
-        # Add labels and taints if provided
-        if parsed_labels:
-            nodepool_data["spec"]["platform"]["gcp"]["labels"] = parsed_labels
-        if parsed_taints:
-            nodepool_data["spec"]["platform"]["gcp"]["taints"] = parsed_taints
-
-        if not cli_context.quiet:
-            cli_context.console.print(
-                f"[bold cyan]Creating NodePool '{nodepool_name}'...[/bold cyan]"
-            )
-
-        # Create nodepool
-        response = api_client.post("/api/v1/nodepools", json_data=nodepool_data)
+            "management": {"autoRepair": auto_repair, "upgradeType": "Replace"},
+        },
+    }
+
+    # Add labels and taints if provided
+    if parsed_labels:
+        nodepool_data["spec"]["platform"]["gcp"]["labels"] = parsed_labels
+    if parsed_taints:
+        nodepool_data["spec"]["platform"]["gcp"]["taints"] = parsed_taints
+
+    if not cli_context.quiet:
+        cli_context.console.print(
+            f"[bold cyan]Creating NodePool '{nodepool_name}'...[/bold cyan]"
+        )
 
-        # Display success
-        if not cli_context.quiet:
-            nodepool_id = response.get("id", "unknown")
-            panel = Panel(
-                f"[green]✓[/green] NodePool '{nodepool_name}' created successfully\n\n"
-                f"ID: {nodepool_id}\n"
-                f"Replicas: {replicas}\n"
-                f"Machine Type: {instance_type}\n"
-                f"Disk: {disk_size}GB {disk_type}\n\n"
-                f"[dim]Use 'gcphcp nodepools status {nodepool_id[:8]}' "
-                f"to monitor creation[/dim]",
-                title="[bold green]NodePool Created[/bold green]",
-                border_style="green",
-            )
-            cli_context.console.print(panel)
-        else:
-            # In quiet mode, print ID for scripting
-            cli_context.console.print(response.get("id"))
-
-    except click.ClickException:
-        raise
-    except ValidationError as e:
-        cli_context.console.print(f"[red]Validation error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except APIError as e:
-        cli_context.console.print(f"[red]API error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except Exception as e:
-        cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        raise click.ClickException(str(e))
+    # Create nodepool
+    response = api_client.post("/api/v1/nodepools", json_data=nodepool_data)
+
+    # Display success
+    if not cli_context.quiet:
+        nodepool_id = response.get("id", "unknown")
+        panel = Panel(
+            f"[green]✓[/green] NodePool '{nodepool_name}' created successfully\n\n"
+            f"ID: {nodepool_id}\n"
+            f"Replicas: {replicas}\n"
+            f"Machine Type: {instance_type}\n"
+            f"Disk: {disk_size}GB {disk_type}\n\n"
+            f"[dim]Use 'gcphcp nodepools status {nodepool_id[:8]}' "
+            f"to monitor creation[/dim]",
+            title="[bold green]NodePool Created[/bold green]",
+            border_style="green",
+        )
+        cli_context.console.print(panel)
+    else:
+        # In quiet mode, print ID for scripting
+        cli_context.console.print(response.get("id"))
 
 
 @nodepools_group.command("status")
@@ -473,6 +541,7 @@ def create_nodepool(
     help="Polling interval in seconds for watch mode (default: 5)",
 )
 @click.pass_obj
+@_cli_error_handler()
 def nodepool_status(
     cli_context: "CLIContext",
     nodepool_identifier: str,
@@ -496,75 +565,89 @@ def nodepool_status(
         gcphcp nodepools status workers --cluster my-cluster \\
             --watch --all
     """
-    try:
-        api_client = cli_context.get_api_client()
-
-        def print_status():
-            # Resolve cluster if provided
-            cluster_id = None
-            if cluster:
-                from .clusters import resolve_cluster_identifier
+    api_client = cli_context.get_api_client()
 
-                cluster_id = resolve_cluster_identifier(api_client, cluster)
-
-            # Resolve nodepool identifier (with optional cluster scope)
-            nodepool_id = resolve_nodepool_identifier(
-                api_client, nodepool_identifier, cluster_id=cluster_id
-            )
-
-            # Fetch nodepool status from the status endpoint
-            status_response = api_client.get(f"/api/v1/nodepools/{nodepool_id}/status")
-
-            # Extract nodepool basic data and status
-            nodepool_data = api_client.get(f"/api/v1/nodepools/{nodepool_id}")
-            controller_status_data = status_response.get("controller_status", [])
+    # Resolve cluster if provided
+    cluster_id = None
+    if cluster:
+        cluster_id = resolve_cluster_identifier(api_client, cluster)
 
-            # Use formatter to display
-            if cli_context.output_format == "table":
-                cli_context.formatter.print_nodepool_status(nodepool_data, nodepool_id)
+    # Resolve nodepool identifier (with optional cluster scope) once; the
+    # ID does not change between watch refreshes
+    nodepool_id = resolve_nodepool_identifier(
+        api_client, nodepool_identifier, cluster_id=cluster_id
+    )
+
+    def fetch_status() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        # Fetch nodepool status from the status endpoint. In watch mode
+        # both GETs are revalidated with the server's ETags.
+        status_response = api_client.get(
+            f"/api/v1/nodepools/{nodepool_id}/status", conditional=watch
+        )
 
-                # Display controller status if --all is used
-                if all:
-                    cli_context.formatter.print_nodepool_controller_status(
-                        controller_status_data, nodepool_id
-                    )
-            else:
-                # For JSON/YAML, always include full data
-                output_data = {
-                    "nodepool_id": nodepool_id,
-                    "status": status_response.get("status", {}),
-                }
-                if all:
-                    output_data["controller_status"] = controller_status_data
-                cli_context.formatter.print_data(output_data)
-
-        if watch:
-            if cli_context.output_format != "table":
-                raise click.ClickException(
-                    "Watch mode is only supported in table format"
+        # Extract nodepool basic data and status, reusing the detail GET
+        # made while resolving a full UUID on the first pass
+        nodepool_data = resolved_nodepools.take(
+            api_client, nodepool_id
+        ) or api_client.get(f"/api/v1/nodepools/{nodepool_id}", conditional=watch)
+        return status_response, nodepool_data
+
+    def print_status(snapshot: Tuple[Dict[str, Any], Dict[str, Any]]) -> None:
+        status_response, nodepool_data = snapshot
+        controller_status_data = status_response.get("controller_status", [])
+
+        # Use formatter to display
+        if cli_context.output_format == "table":
+            cli_context.formatter.print_nodepool_status(nodepool_data, nodepool_id)
+
+            # Display controller status if --all is used
+            if all:
+                cli_context.formatter.print_nodepool_controller_status(
+                    controller_status_data, nodepool_id
                 )
+        else:
+            # For JSON/YAML, always include full data
+            output_data = {
+                "nodepool_id": nodepool_id,
+                "status": status_response.get("status", {}),
+            }
+            if all:
+                output_data["controller_status"] = controller_status_data
+            cli_context.formatter.print_data(output_data)
+
+    if watch:
+        if cli_context.output_format != "table":
+            raise click.ClickException("Watch mode is only supported in table format")
 
-            try:
-                while True:
-                    cli_context.console.clear()
-                    print_status()
+        last_snapshot = None
+        next_tick = time.monotonic()
+        try:
+            while True:
+                snapshot = fetch_status()
+
+                # Only redraw when something changed; unchanged (304)
+                # responses come back as the same cached data
+                if snapshot != last_snapshot:
+                    if cli_context.console.is_terminal:
+                        if last_snapshot is None:
+                            cli_context.console.clear()
+                        else:
+                            cli_context.console.file.write(CURSOR_HOME + ERASE_DOWN)
+                    print_status(snapshot)
                     cli_context.console.print(
-                        f"\n[dim]Refreshing every {interval}s... (Ctrl+C to stop)[/dim]"
+                        f"\n[dim]Refreshing every {interval}s... "
+                        "(Ctrl+C to stop)[/dim]"
                     )
-                    time.sleep(interval)
-            except KeyboardInterrupt:
-                cli_context.console.print("\n[yellow]Watch mode stopped[/yellow]")
-        else:
-            print_status()
+                    last_snapshot = snapshot
 
-    except click.ClickException:
-        raise
-    except APIError as e:
-        cli_context.console.print(f"[red]API error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except Exception as e:
-        cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        raise click.ClickException(str(e))
+                # Keep a steady cadence regardless of how long the
+                # fetch took, without bursting after a slow one
+                next_tick = max(next_tick + interval, time.monotonic())
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+        except KeyboardInterrupt:
+            cli_context.console.print("\n[yellow]Watch mode stopped[/yellow]")
+    else:
+        print_status(fetch_status())
 
 
 @nodepools_group.command("scale")
@@ -580,6 +663,7 @@ def nodepool_status(
     help="Desired number of nodes in the nodepool",
 )
 @click.pass_obj
+@_cli_error_handler(report_validation=True)
 def scale_nodepool(
     cli_context: "CLIContext",
     nodepool_identifier: str,
@@ -600,71 +684,57 @@ def scale_nodepool(
         gcphcp nodepools scale abc12345 --replicas 3
         gcphcp nodepools scale workers --cluster my-cluster --replicas 10
     """
-    try:
-        api_client = cli_context.get_api_client()
+    api_client = cli_context.get_api_client()
 
-        # Validate replicas
-        if replicas < 0:
-            raise click.ClickException("Replicas must be non-negative")
+    # Validate replicas
+    if replicas < 0:
+        raise click.ClickException("Replicas must be non-negative")
 
-        # Resolve cluster if provided
-        cluster_id = None
-        if cluster:
-            from .clusters import resolve_cluster_identifier
-
-            cluster_id = resolve_cluster_identifier(api_client, cluster)
+    # Resolve cluster if provided
+    cluster_id = None
+    if cluster:
+        cluster_id = resolve_cluster_identifier(api_client, cluster)
 
-        # Resolve nodepool identifier (with optional cluster scope)
-        nodepool_id = resolve_nodepool_identifier(
-            api_client, nodepool_identifier, cluster_id=cluster_id
+    # Resolve nodepool identifier (with optional cluster scope)
+    nodepool_id = resolve_nodepool_identifier(
+        api_client, nodepool_identifier, cluster_id=cluster_id
+    )
+
+    # Fetch current nodepool to get the current spec. Resolution only keeps
+    # a detail GET, never a list entry, so the update starts from the full spec
+    nodepool_data = resolved_nodepools.take(api_client, nodepool_id) or api_client.get(
+        f"/api/v1/nodepools/{nodepool_id}"
+    )
+    nodepool_name = nodepool_data.get("name") or nodepool_id
+    current_spec = nodepool_data.get("spec", {})
+    current_replicas = current_spec.get("replicas") or current_spec.get("nodeCount", 0)
+
+    if not cli_context.quiet:
+        cli_context.console.print(
+            f"[bold cyan]Scaling nodepool '{nodepool_name}' "
+            f"from {current_replicas} to {replicas} replicas...[/bold cyan]"
         )
 
-        # Fetch current nodepool to get the current spec
-        nodepool_data = api_client.get(f"/api/v1/nodepools/{nodepool_id}")
-        nodepool_name = nodepool_data.get("name") or nodepool_id
-        current_spec = nodepool_data.get("spec", {})
-        current_replicas = current_spec.get("replicas") or current_spec.get(
-            "nodeCount", 0
-        )
+    # Update only the replicas field in the spec
+    updated_spec = current_spec.copy()
+    updated_spec["replicas"] = replicas
 
-        if not cli_context.quiet:
-            cli_context.console.print(
-                f"[bold cyan]Scaling nodepool '{nodepool_name}' "
-                f"from {current_replicas} to {replicas} replicas...[/bold cyan]"
-            )
-
-        # Update only the replicas field in the spec
-        updated_spec = current_spec.copy()
-        updated_spec["replicas"] = replicas
+    # Send PUT request with updated spec
+    update_payload = {"spec": updated_spec}
+    api_client.put(f"/api/v1/nodepools/{nodepool_id}", json_data=update_payload)
 
-        # Send PUT request with updated spec
-        update_payload = {"spec": updated_spec}
-        api_client.put(f"/api/v1/nodepools/{nodepool_id}", json_data=update_payload)
-
-        if not cli_context.quiet:
-            cli_context.console.print(
-                f"[green]✓[/green] NodePool '{nodepool_name}' "
-                f"scaled to {replicas} replicas"
-            )
-            cli_context.console.print(
-                f"[dim]Use 'gcphcp nodepools status {nodepool_id[:8]}' "
-                f"to monitor the scaling progress[/dim]"
-            )
-        else:
-            # In quiet mode, print the nodepool ID
-            cli_context.console.print(nodepool_id)
-
-    except click.ClickException:
-        raise
-    except ValidationError as e:
-        cli_context.console.print(f"[red]Validation error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except APIError as e:
-        cli_context.console.print(f"[red]API error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except Exception as e:
-        cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        raise click.ClickException(str(e))
+    if not cli_context.quiet:
+        cli_context.console.print(
+            f"[green]✓[/green] NodePool '{nodepool_name}' "
+            f"scaled to {replicas} replicas"
+        )
+        cli_context.console.print(
+            f"[dim]Use 'gcphcp nodepools status {nodepool_id[:8]}' "
+            f"to monitor the scaling progress[/dim]"
+        )
+    else:
+        # In quiet mode, print the nodepool ID
+        cli_context.console.print(nodepool_id)
 
 
 @nodepools_group.command("delete")
@@ -680,6 +750,7 @@ def scale_nodepool(
 )
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 @click.pass_obj
+@_cli_error_handler()
 def delete_nodepool(
     cli_context: "CLIContext",
     nodepool_identifier: str,
@@ -704,70 +775,60 @@ def delete_nodepool(
         gcphcp nodepools delete workers --cluster my-cluster
         gcphcp nodepools delete workers --cluster my-cluster --force
     """
-    try:
-        api_client = cli_context.get_api_client()
+    api_client = cli_context.get_api_client()
 
-        # Resolve cluster if provided
-        cluster_id = None
-        if cluster:
-            from .clusters import resolve_cluster_identifier
-
-            cluster_id = resolve_cluster_identifier(api_client, cluster)
+    # Resolve cluster if provided
+    cluster_id = None
+    if cluster:
+        cluster_id = resolve_cluster_identifier(api_client, cluster)
 
-        # Resolve nodepool identifier (with optional cluster scope)
-        nodepool_id = resolve_nodepool_identifier(
-            api_client, nodepool_identifier, cluster_id=cluster_id
+    # Resolve nodepool identifier (with optional cluster scope)
+    nodepool_id = resolve_nodepool_identifier(
+        api_client, nodepool_identifier, cluster_id=cluster_id
+    )
+
+    # Fetch nodepool details for confirmation
+    nodepool_data = resolved_nodepools.take(api_client, nodepool_id) or api_client.get(
+        f"/api/v1/nodepools/{nodepool_id}"
+    )
+    nodepool_name = nodepool_data.get("name") or nodepool_id
+
+    # Get node info for confirmation message
+    spec = nodepool_data.get("spec", {})
+    replicas = spec.get("replicas") or spec.get("nodeCount") or 0
+
+    # Confirm deletion unless --yes or --force
+    if not (yes or force):
+        cli_context.console.print(
+            f"[yellow]⚠ Warning: You are about to delete nodepool "
+            f"'{nodepool_name}'[/yellow]"
         )
+        cli_context.console.print(f"  ID: {nodepool_id}")
+        cli_context.console.print(f"  Replicas: {replicas}")
+        cli_context.console.print("\n[red]This action cannot be undone![/red]\n")
 
-        # Fetch nodepool details for confirmation
-        nodepool_data = api_client.get(f"/api/v1/nodepools/{nodepool_id}")
-        nodepool_name = nodepool_data.get("name") or nodepool_id
-
-        # Get node info for confirmation message
-        spec = nodepool_data.get("spec", {})
-        replicas = spec.get("replicas") or spec.get("nodeCount") or 0
-
-        # Confirm deletion unless --yes or --force
-        if not (yes or force):
+        # Show force warning if there are active nodes
+        if replicas and replicas > 0:
             cli_context.console.print(
-                f"[yellow]⚠ Warning: You are about to delete nodepool "
-                f"'{nodepool_name}'[/yellow]"
+                f"[yellow]This nodepool has {replicas} node(s). "
+                "Use --force to delete anyway.[/yellow]\n"
             )
-            cli_context.console.print(f"  ID: {nodepool_id}")
-            cli_context.console.print(f"  Replicas: {replicas}")
-            cli_context.console.print("\n[red]This action cannot be undone![/red]\n")
 
-            # Show force warning if there are active nodes
-            if replicas and replicas > 0:
-                cli_context.console.print(
-                    f"[yellow]This nodepool has {replicas} node(s). "
-                    "Use --force to delete anyway.[/yellow]\n"
-                )
-
-            if not click.confirm("Do you want to continue?"):
-                cli_context.console.print("[yellow]Deletion cancelled[/yellow]")
-                return
-
-        if not cli_context.quiet:
-            cli_context.console.print(
-                f"[bold cyan]Deleting nodepool '{nodepool_name}'...[/bold cyan]"
-            )
+        if not click.confirm("Do you want to continue?"):
+            cli_context.console.print("[yellow]Deletion cancelled[/yellow]")
+            return
 
-        # Delete nodepool with force parameter
-        # Always include force=true as API requires it for actual deletion
-        params = {"force": "true"}
-        api_client.delete(f"/api/v1/nodepools/{nodepool_id}", params=params)
+    if not cli_context.quiet:
+        cli_context.console.print(
+            f"[bold cyan]Deleting nodepool '{nodepool_name}'...[/bold cyan]"
+        )
 
-        if not cli_context.quiet:
-            cli_context.console.print(
-                f"[green]✓[/green] NodePool '{nodepool_name}' deleted successfully"
-            )
+    # Delete nodepool with force parameter
+    # Always include force=true as API requires it for actual deletion
+    params = {"force": "true"}
+    api_client.delete(f"/api/v1/nodepools/{nodepool_id}", params=params)
 
-    except click.ClickException:
-        raise
-    except APIError as e:
-        cli_context.console.print(f"[red]API error: {e}[/red]")
-        raise click.ClickException(str(e))
-    except Exception as e:
-        cli_context.console.print(f"[red]Unexpected error: {e}[/red]")
-        raise click.ClickException(str(e))
+    if not cli_context.quiet:
+        cli_context.console.print(
+            f"[green]✓[/green] NodePool '{nodepool_name}' deleted successfully"
+        )
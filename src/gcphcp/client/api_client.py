@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
@@ -63,6 +63,9 @@ class APIClient:
         self.timeout = timeout
         self.user_agent = user_agent
 
+        # ETag and data of the last conditional GET, keyed by URL and params
+        self._etag_cache: Dict[Tuple[str, Tuple], Tuple[str, Dict[str, Any]]] = {}
+
         # Create session with retry strategy
         self.session = requests.Session()
         self._setup_retry_strategy(retries, backoff_factor)
@@ -225,6 +228,7 @@ class APIClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        conditional: bool = False,
     ) -> Dict[str, Any]:
         """Make HTTP request to API.
 
@@ -234,6 +238,8 @@ class APIClient:
             params: Query parameters
             json_data: JSON data for request body
             headers: Additional headers
+            conditional: Revalidate against the ETag of the previous response
+                for the same URL and params, reusing its data on 304
 
         Returns:
             Parsed response data
@@ -244,10 +250,15 @@ class APIClient:
         url = self._build_url(path)
 
         # Prepare headers
-        request_headers = self._get_auth_headers()
+        request_headers = dict(self._get_auth_headers())
         if headers:
             request_headers.update(headers)
 
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(cache_key) if conditional else None
+        if cached:
+            request_headers["If-None-Match"] = cached[0]
+
         logger.debug(f"Making {method} request to {url}")
 
         try:
@@ -260,7 +271,20 @@ class APIClient:
                 timeout=self.timeout,
             )
 
-            return self._handle_response(response)
+            if cached and response.status_code == 304:
+                logger.debug(f"{url} not modified, reusing cached response")
+                return cached[1]
+
+            response_data = self._handle_response(response)
+
+            if conditional:
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag_cache[cache_key] = (etag, response_data)
+                else:
+                    self._etag_cache.pop(cache_key, None)
+
+            return response_data
 
         except Timeout as e:
             raise APITimeoutError(
@@ -276,6 +300,7 @@ class APIClient:
         path: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        conditional: bool = False,
     ) -> Dict[str, Any]:
         """Make GET request.
 
@@ -283,11 +308,15 @@ class APIClient:
             path: API path
             params: Query parameters
             headers: Additional headers
+            conditional: Send If-None-Match with the ETag of the previous
+                response and return its data again on 304 Not Modified
 
         Returns:
             Parsed response data
         """
-        return self._make_request("GET", path, params=params, headers=headers)
+        return self._make_request(
+            "GET", path, params=params, headers=headers, conditional=conditional
+        )
 
     def post(
         self,
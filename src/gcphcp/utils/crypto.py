@@ -17,6 +17,7 @@ class KeypairResult(NamedTuple):
     private_key_pem_base64: str
     jwks_file_path: str
     kid: str  # Key ID calculated from DER-encoded public key
+    jwks_json: str = ""  # JWKS document the file was written from
 
     def cleanup(self):
         """Clean up temporary files."""
@@ -29,7 +30,7 @@ class KeypairResult(NamedTuple):
             pass
 
 
-def generate_cluster_keypair() -> KeypairResult:
+def generate_cluster_keypair(write_jwks_file: bool = True) -> KeypairResult:
     """Generate RSA keypair for cluster signing and create JWKS file.
 
     This function:
@@ -37,7 +38,7 @@ def generate_cluster_keypair() -> KeypairResult:
     2. Converts private key to PEM format (PKCS#1/TraditionalOpenSSL)
     3. Base64-encodes the PEM for storage
     4. Converts public key to JWKS format using SHA256(DER) for kid
-    5. Writes JWKS to a temporary file
+    5. Writes JWKS to a temporary file, unless write_jwks_file is False
 
     The key format and size match generate-sa-signing-key.sh:
     - 4096-bit RSA key
@@ -47,12 +48,18 @@ def generate_cluster_keypair() -> KeypairResult:
     The kid (Key ID) is calculated using SHA256 hash of the DER-encoded public key,
     which is the industry-standard method used by Kubernetes and most OIDC providers.
 
+    Args:
+        write_jwks_file: Whether to write the JWKS to a temporary file. Callers
+            that save jwks_json themselves can skip it.
+
     Returns:
         KeypairResult containing:
             - private_key_pem: PEM-encoded private key string (PKCS#1)
             - private_key_pem_base64: Base64-encoded PEM private key (for API)
-            - jwks_file_path: Path to temporary JWKS file (caller should cleanup)
+            - jwks_file_path: Path to temporary JWKS file (caller should cleanup),
+              or an empty string if write_jwks_file is False
             - kid: Key ID (SHA256 hash of DER-encoded public key)
+            - jwks_json: JWKS document as a JSON string
 
     Raises:
         Exception: If keypair generation or file operations fail
@@ -72,15 +79,19 @@ def generate_cluster_keypair() -> KeypairResult:
     jwks_data, kid = public_key_to_jwks(public_key)
 
     # Write JWKS to temporary file
-    jwks_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-    jwks_file.write(jwks_data)
-    jwks_file.close()
+    jwks_file_path = ""
+    if write_jwks_file:
+        jwks_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
+        jwks_file.write(jwks_data)
+        jwks_file.close()
+        jwks_file_path = jwks_file.name
 
     return KeypairResult(
         private_key_pem=private_key_pem,
         private_key_pem_base64=private_key_pem_base64,
-        jwks_file_path=jwks_file.name,
+        jwks_file_path=jwks_file_path,
         kid=kid,
+        jwks_json=jwks_data,
     )
 
 
@@ -177,6 +188,44 @@ def public_key_to_jwks(public_key: rsa.RSAPublicKey) -> Tuple[str, str]:
     return json.dumps(jwks, indent=2), kid
 
 
+def signing_key_matches_jwks(private_key_pem: str, jwks_json: str) -> bool:
+    """Check that a JWKS document publishes the public half of a signing key.
+
+    The public JWK is derived from the private key the same way
+    public_key_to_jwks builds it, and its kid, modulus and exponent must
+    appear together in one of the JWKS keys.
+
+    Args:
+        private_key_pem: PEM-encoded RSA private key
+        jwks_json: JWKS document as a JSON string
+
+    Returns:
+        True if the JWKS contains the key's public JWK, False otherwise
+
+    Raises:
+        ValueError: If the private key cannot be loaded
+    """
+    private_key = serialization.load_pem_private_key(
+        private_key_pem.encode("utf-8"), password=None, backend=default_backend()
+    )
+    if not isinstance(private_key, rsa.RSAPrivateKey):
+        return False
+
+    expected_jwks, _ = public_key_to_jwks(private_key.public_key())
+    expected = json.loads(expected_jwks)["keys"][0]
+
+    try:
+        keys = json.loads(jwks_json).get("keys") or []
+    except (ValueError, AttributeError):
+        return False
+
+    return any(
+        isinstance(key, dict)
+        and all(key.get(field) == expected[field] for field in ("kid", "n", "e"))
+        for key in keys
+    )
+
+
 def base64_encode_pem(pem_key: str) -> str:
     """Base64-encode a PEM key string.
 
@@ -1,18 +1,108 @@
 """Output formatting utilities for GCP HCP CLI."""
 
+import csv
+import functools
+import io
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import yaml
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml's C emitter when PyYAML was built with it. The full (not safe)
+# dumper keeps yaml.dump's support for tuples and other Python types.
+try:
+    from yaml import CDumper as _YamlDumper
+except ImportError:
+    from yaml import Dumper as _YamlDumper  # type: ignore[assignment]
+
+
+# Rich colors for status values, shared by the status printers
+_PHASE_COLOR = {
+    "Ready": "green",
+    "Progressing": "yellow",
+    "Pending": "blue",
+    "Failed": "red",
+}
+_COND_COLOR = {"True": "green", "False": "red", "Unknown": "yellow"}
+# For conditions such as Degraded, True is the bad state
+_NEGATIVE_COND_COLOR = {"True": "red", "False": "green", "Unknown": "yellow"}
+_NEGATIVE_CONDITIONS = frozenset({"Degraded", "Progressing"})
+# Conditions on resources reported by the nodepool and cluster controllers
+_NODEPOOL_NEGATIVE_CONDITIONS = _NEGATIVE_CONDITIONS | {
+    "UpdatingVersion",
+    "UpdatingConfig",
+    "UpdatingPlatformMachineTemplate",
+}
+_RESOURCE_NEGATIVE_CONDITIONS = _NEGATIVE_CONDITIONS | {"Issuing"}
+_RESOURCE_STATUS_COLOR = {
+    "Created": "green",
+    "Ready": "green",
+    "Available": "green",
+    "Failed": "red",
+    "Pending": "yellow",
+}
+
+
+# Fields shown at the top of print_resource_details, in display order
+_BASIC_FIELDS = (
+    "id",
+    "name",
+    "target_project_id",
+    "created_by",
+    "created_at",
+    "updated_at",
+)
+_DATETIME_FIELDS = frozenset({"created_at", "updated_at"})
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _titleize(key: str) -> str:
+    """Turn a snake_case field name into a display label.
+
+    Args:
+        key: Field name such as "created_at"
+
+    Returns:
+        Title-cased label such as "Created At"
+    """
+    return key.replace("_", " ").title()
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_datetime(dt_string: str) -> str:
+    """Format an ISO datetime string for display.
+
+    Status payloads repeat the same timestamps across many conditions, so
+    results are cached by the raw string.
+
+    Args:
+        dt_string: ISO datetime string
+
+    Returns:
+        Formatted datetime string, or the input if it cannot be parsed
+    """
+    try:
+        # Parse ISO format datetime
+        dt = datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+        # Same layout as strftime("%Y-%m-%d %H:%M:%S UTC"), without parsing
+        # a format string on every call
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} UTC"
+        )
+    except Exception:
+        # Return original string if parsing fails
+        return dt_string
+
 
 class OutputFormatter:
     """Output formatter supporting multiple formats like gcloud CLI."""
@@ -59,6 +149,7 @@ class OutputFormatter:
             title: Optional table title
             columns: Optional list of column names to include
         """
+        # Empty data gets the same notice in every format
         if not data:
             if title:
                 self.console.print(f"[yellow]No data found for {title}[/yellow]")
@@ -89,6 +180,32 @@ class OutputFormatter:
 
         self.console.print(table)
 
+    def print_table_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        columns: List[str],
+        title: Optional[str] = None,
+    ) -> None:
+        """Print rows that are already in column order as a table.
+
+        Unlike print_table, no per-cell key lookups are needed, so callers
+        that build rows themselves can skip the intermediate dicts.
+
+        Args:
+            rows: Row values, ordered like columns
+            columns: Column names
+            title: Optional table title
+        """
+        table = Table(title=title, show_header=True, header_style="bold blue")
+
+        for column in columns:
+            table.add_column(column, style="white")
+
+        for row in rows:
+            table.add_row(*map(str, row))
+
+        self.console.print(table)
+
     def print_resource_details(
         self,
         resource: Dict[str, Any],
@@ -108,28 +225,22 @@ class OutputFormatter:
         table = Table(title=title, show_header=False, box=None)
         table.add_column("Field", style="cyan", width=20)
         table.add_column("Value", style="white")
+        add_row = table.add_row
 
         # Add basic fields
-        basic_fields = [
-            "id",
-            "name",
-            "target_project_id",
-            "created_by",
-            "created_at",
-            "updated_at",
-        ]
-        for field in basic_fields:
-            if field in resource:
-                value = resource[field]
-                if field.endswith("_at") and value:
-                    value = self.format_datetime(value)
-                table.add_row(field.replace("_", " ").title(), str(value))
+        for field in _BASIC_FIELDS:
+            value = resource.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            if field in _DATETIME_FIELDS and value:
+                value = self.format_datetime(value)
+            add_row(_titleize(field), str(value))
 
         # Add status information
         if "status" in resource:
             status = resource["status"]
-            table.add_row("", "")  # Separator
-            table.add_row("Status", "")
+            add_row("", "")  # Separator
+            add_row("Status", "")
 
             if isinstance(status, dict):
                 for key, value in status.items():
@@ -141,20 +252,20 @@ class OutputFormatter:
                             )
                             if condition.get("message"):
                                 condition_text += f" ({condition['message']})"
-                            table.add_row(f"  Condition {i+1}", condition_text)
+                            add_row(f"  Condition {i+1}", condition_text)
                     else:
-                        table.add_row(f"  {key.replace('_', ' ').title()}", str(value))
+                        add_row(f"  {_titleize(key)}", str(value))
 
         # Add spec information if present
         if "spec" in resource and resource["spec"]:
-            table.add_row("", "")  # Separator
-            table.add_row("Specification", "")
+            add_row("", "")  # Separator
+            add_row("Specification", "")
             spec = resource["spec"]
             if isinstance(spec, dict):
                 for key, value in spec.items():
                     if isinstance(value, (dict, list)):
                         value = f"[{type(value).__name__}]"
-                    table.add_row(f"  {key.replace('_', ' ').title()}", str(value))
+                    add_row(f"  {_titleize(key)}", str(value))
 
         self.console.print(table)
 
@@ -189,41 +300,38 @@ class OutputFormatter:
         )
         table.add_column("Field", style="cyan", width=20)
         table.add_column("Value", style="white")
+        add_row = table.add_row
 
         # Basic cluster info
-        table.add_row("Cluster ID", cluster_id)
-        table.add_row("Cluster Name", cluster_data.get("name", "Unknown"))
-        table.add_row("Project", cluster_data.get("target_project_id", "Unknown"))
-        table.add_row("Created By", cluster_data.get("created_by", "Unknown"))
-
-        # Network configuration (from spec.platform.gcp)
-        spec = cluster_data.get("spec", {})
-        platform = spec.get("platform", {})
-        gcp_config = platform.get("gcp", {})
+        add_row("Cluster ID", cluster_id)
+        add_row("Cluster Name", cluster_data.get("name", "Unknown"))
+        add_row("Project", cluster_data.get("target_project_id", "Unknown"))
+        add_row("Created By", cluster_data.get("created_by", "Unknown"))
+
+        # Network configuration (from spec.platform.gcp); the platform
+        # section below reuses these bindings
+        spec = cluster_data.get("spec") or {}
+        platform = spec.get("platform") or {}
+        gcp_config = platform.get("gcp") or {}
         if gcp_config:
-            table.add_row("", "")  # Separator
-            table.add_row("[bold]Network Configuration[/bold]", "")
+            add_row("", "")  # Separator
+            add_row("[bold]Network Configuration[/bold]", "")
             if gcp_config.get("network"):
-                table.add_row("  Network", gcp_config["network"])
+                add_row("  Network", gcp_config["network"])
             if gcp_config.get("subnet"):
-                table.add_row("  Subnet", gcp_config["subnet"])
+                add_row("  Subnet", gcp_config["subnet"])
             endpoint_access = gcp_config.get("endpointAccess", "Private")
-            table.add_row("  Endpoint Access", endpoint_access)
+            add_row("  Endpoint Access", endpoint_access)
 
         status = cluster_data.get("status", {})
         if status:
-            table.add_row("", "")  # Separator
-            table.add_row("[bold]Current Status[/bold]", "")
+            add_row("", "")  # Separator
+            add_row("[bold]Current Status[/bold]", "")
 
             # Phase with color coding
             phase = status.get("phase", "Unknown")
-            phase_color = {
-                "Ready": "green",
-                "Progressing": "yellow",
-                "Pending": "blue",
-                "Failed": "red",
-            }.get(phase, "white")
-            table.add_row("  Phase", f"[{phase_color}]{phase}[/{phase_color}]")
+            phase_color = _PHASE_COLOR.get(phase, "white")
+            add_row("  Phase", f"[{phase_color}]{phase}[/{phase_color}]")
 
             # Generation info
             if "observedGeneration" in status:
@@ -235,25 +343,25 @@ class OutputFormatter:
                     gen_status = (
                         f"[yellow]{gen_current}[/yellow] (desired: {gen_desired})"
                     )
-                table.add_row("  Generation", gen_status)
+                add_row("  Generation", gen_status)
 
             # Status message
             if status.get("message"):
-                table.add_row("  Message", status["message"])
+                add_row("  Message", status["message"])
 
             if status.get("reason"):
-                table.add_row("  Reason", status["reason"])
+                add_row("  Reason", status["reason"])
 
             # Last update time
             if status.get("lastUpdateTime"):
                 update_time = self.format_datetime(status["lastUpdateTime"])
-                table.add_row("  Last Update", update_time)
+                add_row("  Last Update", update_time)
 
             # Conditions
             conditions = status.get("conditions", [])
             if conditions:
-                table.add_row("", "")  # Separator
-                table.add_row("[bold]Conditions[/bold]", "")
+                add_row("", "")  # Separator
+                add_row("[bold]Conditions[/bold]", "")
 
                 for i, condition in enumerate(conditions):
                     condition_type = condition.get("type", "Unknown")
@@ -261,39 +369,30 @@ class OutputFormatter:
                     condition_message = condition.get("message", "")
 
                     # Color code the status
-                    status_color = {
-                        "True": "green",
-                        "False": "red",
-                        "Unknown": "yellow",
-                    }.get(condition_status, "white")
+                    status_color = _COND_COLOR.get(condition_status, "white")
 
                     status_text = f"[{status_color}]{condition_status}[/{status_color}]"
                     if condition_message:
                         status_text += f" - {condition_message}"
 
-                    table.add_row(f"  {condition_type}", status_text)
+                    add_row(f"  {condition_type}", status_text)
 
                     # Add transition time if available
                     if condition.get("lastTransitionTime"):
                         transition_time = self.format_datetime(
                             condition["lastTransitionTime"]
                         )
-                        table.add_row(
-                            "    Last Transition", f"[dim]{transition_time}[/dim]"
-                        )
+                        add_row("    Last Transition", f"[dim]{transition_time}[/dim]")
 
         # Platform information
-        spec = cluster_data.get("spec", {})
-        platform = spec.get("platform", {})
         if platform:
-            table.add_row("", "")  # Separator
-            table.add_row("[bold]Platform[/bold]", "")
-            table.add_row("  Type", platform.get("type", "Unknown"))
+            add_row("", "")  # Separator
+            add_row("[bold]Platform[/bold]", "")
+            add_row("  Type", platform.get("type", "Unknown"))
 
-            if platform.get("gcp"):
-                gcp_info = platform["gcp"]
-                table.add_row("  GCP Project", gcp_info.get("projectID", "Unknown"))
-                table.add_row("  GCP Region", gcp_info.get("region", "Unknown"))
+            if gcp_config:
+                add_row("  GCP Project", gcp_config.get("projectID", "Unknown"))
+                add_row("  GCP Region", gcp_config.get("region", "Unknown"))
 
         self.console.print(table)
 
@@ -310,20 +409,19 @@ class OutputFormatter:
             nodepools: List of nodepool dictionaries
             show_empty: Whether to show section if no nodepools exist
         """
-        from ..models.nodepool import NodePool
-
         if self.format_type != "table":
             return  # Non-table formats handle this differently
 
+        from ..models.nodepool import NodePool
+
         if not nodepools and not show_empty:
             return
 
-        # Create spacing
-        self.console.print()
-
         if not nodepools:
-            self.console.print("[bold]NodePools[/bold]")
-            self.console.print("[dim]  No nodepools found for this cluster[/dim]")
+            self.console.print(
+                "\n[bold]NodePools[/bold]\n"
+                "[dim]  No nodepools found for this cluster[/dim]"
+            )
             return
 
         # Create nodepools table matching cluster status style
@@ -355,11 +453,7 @@ class OutputFormatter:
 
             # Display Ready condition
             if ready_condition:
-                ready_color = {
-                    "True": "green",
-                    "False": "red",
-                    "Unknown": "yellow",
-                }.get(ready_condition.status, "white")
+                ready_color = _COND_COLOR.get(ready_condition.status, "white")
 
                 ready_text = f"[{ready_color}]{ready_condition.status}[/{ready_color}]"
                 if ready_condition.message:
@@ -368,11 +462,7 @@ class OutputFormatter:
 
             # Display Available condition
             if available_condition:
-                available_color = {
-                    "True": "green",
-                    "False": "red",
-                    "Unknown": "yellow",
-                }.get(available_condition.status, "white")
+                available_color = _COND_COLOR.get(available_condition.status, "white")
 
                 available_text = (
                     f"[{available_color}]{available_condition.status}"
@@ -382,7 +472,8 @@ class OutputFormatter:
                     available_text += f" - {available_condition.message}"
                 table.add_row("    Available", available_text)
 
-        self.console.print(table)
+        # Blank line for spacing, printed together with the table
+        self.console.print(Group(Text(), table))
 
     def print_nodepool_status(
         self, nodepool_data: Dict[str, Any], nodepool_id: str
@@ -393,12 +484,12 @@ class OutputFormatter:
             nodepool_data: Full nodepool data including status
             nodepool_id: NodePool identifier
         """
-        from ..models.nodepool import NodePool
-
         if self.format_type != "table":
             self.print_data({"nodepool_id": nodepool_id, "nodepool": nodepool_data})
             return
 
+        from ..models.nodepool import NodePool
+
         nodepool = NodePool.from_api_response(nodepool_data)
 
         # Create status table (match cluster status style)
@@ -453,12 +544,7 @@ class OutputFormatter:
 
             # Phase with color
             phase = nodepool.status.phase or "Unknown"
-            phase_color = {
-                "Ready": "green",
-                "Progressing": "yellow",
-                "Pending": "blue",
-                "Failed": "red",
-            }.get(phase, "white")
+            phase_color = _PHASE_COLOR.get(phase, "white")
             table.add_row("  Phase", f"[{phase_color}]{phase}[/{phase_color}]")
 
             # Generation info (matching cluster style)
@@ -498,11 +584,7 @@ class OutputFormatter:
                 table.add_row("[bold]Conditions[/bold]", "")
 
                 for condition in nodepool.status.conditions:
-                    status_color = {
-                        "True": "green",
-                        "False": "red",
-                        "Unknown": "yellow",
-                    }.get(condition.status, "white")
+                    status_color = _COND_COLOR.get(condition.status, "white")
 
                     status_text = f"[{status_color}]{condition.status}[/{status_color}]"
                     if condition.message:
@@ -556,9 +638,7 @@ class OutputFormatter:
             # For non-table formats, the data is already included in the main output
             return
 
-        # Add spacing before controller status section
-        self.console.print()
-
+        # Each branch prints a blank spacing line and its table in one call
         if not controller_status_data:
             # Show that we requested controller data but none is available
             table = Table(show_header=False, box=None)
@@ -568,7 +648,7 @@ class OutputFormatter:
                 "[bold]Controller Status[/bold]",
                 "[dim]No controller status available yet[/dim]",
             )
-            self.console.print(table)
+            self.console.print(Group(Text(), table))
             return
 
         # Create controller status table
@@ -605,20 +685,13 @@ class OutputFormatter:
 
                     # Color code based on status and condition type
                     # For "negative" conditions, True is bad, False is good
-                    negative_conditions = ["Degraded", "Progressing"]
-                    if condition_type in negative_conditions:
-                        status_color = {
-                            "True": "red",
-                            "False": "green",
-                            "Unknown": "yellow",
-                        }.get(condition_status, "white")
+                    if condition_type in _NEGATIVE_CONDITIONS:
+                        status_color = _NEGATIVE_COND_COLOR.get(
+                            condition_status, "white"
+                        )
                     else:
                         # For "positive" conditions, True is good, False is bad
-                        status_color = {
-                            "True": "green",
-                            "False": "red",
-                            "Unknown": "yellow",
-                        }.get(condition_status, "white")
+                        status_color = _COND_COLOR.get(condition_status, "white")
 
                     status_text = f"[{status_color}]{condition_status}[/{status_color}]"
                     if condition_message:
@@ -636,13 +709,7 @@ class OutputFormatter:
                 table.add_row("  Resources", "")
                 for resource_type, resource_data in resources.items():
                     resource_status = resource_data.get("status", "Unknown")
-                    status_color = {
-                        "Created": "green",
-                        "Ready": "green",
-                        "Available": "green",
-                        "Failed": "red",
-                        "Pending": "yellow",
-                    }.get(resource_status, "white")
+                    status_color = _RESOURCE_STATUS_COLOR.get(resource_status, "white")
 
                     table.add_row(
                         f"    {resource_type.title()}",
@@ -661,30 +728,16 @@ class OutputFormatter:
                             condition_message = condition.get("message", "")
 
                             # Color code based on status and condition type
-                            # For "negative" conditions (Degraded, Progressing,
-                            # UpdatingVersion, UpdatingConfig,
-                            # UpdatingPlatformMachineTemplate),
-                            # True is bad, False is good
-                            negative_conditions = [
-                                "Degraded",
-                                "Progressing",
-                                "UpdatingVersion",
-                                "UpdatingConfig",
-                                "UpdatingPlatformMachineTemplate",
-                            ]
-                            if condition_type in negative_conditions:
-                                status_color = {
-                                    "True": "red",
-                                    "False": "green",
-                                    "Unknown": "yellow",
-                                }.get(condition_status, "white")
+                            # For "negative" conditions, True is bad, False is good
+                            if condition_type in _NODEPOOL_NEGATIVE_CONDITIONS:
+                                status_color = _NEGATIVE_COND_COLOR.get(
+                                    condition_status, "white"
+                                )
                             else:
                                 # For "positive" conditions, True is good, False is bad
-                                status_color = {
-                                    "True": "green",
-                                    "False": "red",
-                                    "Unknown": "yellow",
-                                }.get(condition_status, "white")
+                                status_color = _COND_COLOR.get(
+                                    condition_status, "white"
+                                )
 
                             display_text = (
                                 f"[{status_color}]{condition_status}"
@@ -710,7 +763,7 @@ class OutputFormatter:
                     for key, value in other_metadata.items():
                         table.add_row(f"    {key}", str(value))
 
-        self.console.print(table)
+        self.console.print(Group(Text(), table))
 
     def print_controller_status(
         self, controller_data: Dict[str, Any], cluster_id: str
@@ -737,41 +790,34 @@ class OutputFormatter:
         )
         table.add_column("Field", style="cyan", width=44)
         table.add_column("Value", style="white")
+        add_row = table.add_row
 
         for i, controller in enumerate(controller_statuses):
             if i > 0:
-                table.add_row("", "")  # Separator between controllers
+                add_row("", "")  # Separator between controllers
 
             controller_name = controller.get("controller_name", "Unknown")
-            table.add_row(
-                f"[bold]Controller {i+1}[/bold]", f"[bold]{controller_name}[/bold]"
-            )
+            add_row(f"[bold]Controller {i+1}[/bold]", f"[bold]{controller_name}[/bold]")
 
             # Controller-level info
             if controller.get("observed_generation"):
-                table.add_row(
-                    "  Observed Generation", str(controller["observed_generation"])
-                )
+                add_row("  Observed Generation", str(controller["observed_generation"]))
 
             if controller.get("last_updated"):
                 last_updated = self.format_datetime(controller["last_updated"])
-                table.add_row("  Last Updated", last_updated)
+                add_row("  Last Updated", last_updated)
 
             # Controller conditions
             conditions = controller.get("conditions", [])
             if conditions:
-                table.add_row("  Conditions", "")
+                add_row("  Conditions", "")
                 for condition in conditions:
                     condition_type = condition.get("type", "Unknown")
                     condition_status = condition.get("status", "Unknown")
                     condition_message = condition.get("message", "")
 
                     # Color code the status
-                    status_color = {
-                        "True": "green",
-                        "False": "red",
-                        "Unknown": "yellow",
-                    }.get(condition_status, "white")
+                    status_color = _COND_COLOR.get(condition_status, "white")
 
                     status_text = f"[{status_color}]{condition_status}[/{status_color}]"
                     if condition_message:
@@ -780,24 +826,18 @@ class OutputFormatter:
                             condition_message = condition_message[:77] + "..."
                         status_text += f" - {condition_message}"
 
-                    table.add_row(f"    {condition_type}", status_text)
+                    add_row(f"    {condition_type}", status_text)
 
             # Resource details from metadata
             metadata = controller.get("metadata", {})
             resources = metadata.get("resources", {})
             if resources:
-                table.add_row("  Resources", "")
+                add_row("  Resources", "")
                 for resource_type, resource_data in resources.items():
                     resource_status = resource_data.get("status", "Unknown")
-                    status_color = {
-                        "Created": "green",
-                        "Ready": "green",
-                        "Available": "green",
-                        "Failed": "red",
-                        "Pending": "yellow",
-                    }.get(resource_status, "white")
+                    status_color = _RESOURCE_STATUS_COLOR.get(resource_status, "white")
 
-                    table.add_row(
+                    add_row(
                         f"    {resource_type.title()}",
                         f"[{status_color}]{resource_status}[/{status_color}]",
                     )
@@ -814,22 +854,16 @@ class OutputFormatter:
                             condition_message = condition.get("message", "")
 
                             # Color code based on status and condition type
-                            # For "negative" conditions (Degraded, Progressing,
-                            # Issuing), True is bad, False is good
-                            negative_conditions = ["Degraded", "Progressing", "Issuing"]
-                            if condition_type in negative_conditions:
-                                status_color = {
-                                    "True": "red",
-                                    "False": "green",
-                                    "Unknown": "yellow",
-                                }.get(condition_status, "white")
+                            # For "negative" conditions, True is bad, False is good
+                            if condition_type in _RESOURCE_NEGATIVE_CONDITIONS:
+                                status_color = _NEGATIVE_COND_COLOR.get(
+                                    condition_status, "white"
+                                )
                             else:
                                 # For "positive" conditions, True is good, False is bad
-                                status_color = {
-                                    "True": "green",
-                                    "False": "red",
-                                    "Unknown": "yellow",
-                                }.get(condition_status, "white")
+                                status_color = _COND_COLOR.get(
+                                    condition_status, "white"
+                                )
 
                             display_text = (
                                 f"[{status_color}]{condition_status}"
@@ -841,10 +875,10 @@ class OutputFormatter:
                                     condition_message = condition_message[:97] + "..."
                                 display_text += f" - {condition_message}"
 
-                            table.add_row(f"      {condition_type}", display_text)
+                            add_row(f"      {condition_type}", display_text)
 
-        self.console.print("\n")  # Add some spacing
-        self.console.print(table)
+        # Two blank lines for spacing, printed together with the table
+        self.console.print(Group(Text("\n"), table))
 
     def print_original_cluster_status(
         self, status_data: Dict[str, Any], cluster_id: str
@@ -861,12 +895,7 @@ class OutputFormatter:
 
         # Overall status panel
         phase = status_data.get("phase", "Unknown")
-        phase_color = {
-            "Ready": "green",
-            "Progressing": "yellow",
-            "Pending": "blue",
-            "Failed": "red",
-        }.get(phase, "white")
+        phase_color = _PHASE_COLOR.get(phase, "white")
 
         status_text = Text()
         status_text.append(f"Phase: {phase}\n", style=f"{phase_color} bold")
@@ -884,7 +913,8 @@ class OutputFormatter:
             title=f"[bold]Cluster Status: {cluster_id}[/bold]",
             border_style=phase_color,
         )
-        self.console.print(panel)
+        # The panel and tables are printed together in one call
+        renderables: List[RenderableType] = [panel]
 
         # Conditions table
         conditions = status_data.get("conditions", [])
@@ -911,7 +941,7 @@ class OutputFormatter:
                     condition.get("message", ""),
                 )
 
-            self.console.print(table)
+            renderables.append(table)
 
         # Controller statuses
         controller_statuses = status_data.get("controllerStatuses", [])
@@ -934,7 +964,9 @@ class OutputFormatter:
                     last_updated,
                 )
 
-            self.console.print(table)
+            renderables.append(table)
+
+        self.console.print(Group(*renderables))
 
     def format_datetime(self, dt_string: Optional[str]) -> str:
         """Format datetime string for display.
@@ -947,14 +979,7 @@ class OutputFormatter:
         """
         if not dt_string:
             return ""
-
-        try:
-            # Parse ISO format datetime
-            dt = datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-        except Exception:
-            # Return original string if parsing fails
-            return dt_string
+        return _format_datetime(dt_string)
 
     def _print_json(self, data: Any) -> None:
         """Print data as JSON."""
@@ -966,50 +991,57 @@ class OutputFormatter:
             self.console.file.flush()
         except Exception as e:
             logger.error(f"Failed to format as JSON: {e}")
-            self.console.print(str(data))
+            self.console.print(str(data), markup=False, highlight=False, soft_wrap=True)
 
     def _print_yaml(self, data: Any) -> None:
         """Print data as YAML."""
         try:
-            yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True)
-            self.console.print(yaml_str)
+            yaml_str = yaml.dump(
+                data,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+            )
+            self.console.print(yaml_str, markup=False, highlight=False, soft_wrap=True)
         except Exception as e:
             logger.error(f"Failed to format as YAML: {e}")
-            self.console.print(str(data))
+            self.console.print(str(data), markup=False, highlight=False, soft_wrap=True)
 
     def _print_csv(self, data: Any) -> None:
         """Print data as CSV."""
         if isinstance(data, list) and data and isinstance(data[0], dict):
-            # Print header
             headers = list(data[0].keys())
-            self.console.print(",".join(headers))
-
-            # Print rows
-            for item in data:
-                row = [str(item.get(header, "")) for header in headers]
-                # Escape commas and quotes
-                escaped_row = []
-                for field in row:
-                    if "," in field or '"' in field:
-                        # Escape double quotes by doubling them, then wrap in quotes
-                        escaped_field = field.replace('"', '""')
-                        field = f'"{escaped_field}"'
-                    escaped_row.append(field)
-                self.console.print(",".join(escaped_row))
+
+            # Build the whole document and print it once; csv handles quoting
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(headers)
+            writer.writerows(
+                [str(item.get(header, "")) for header in headers] for item in data
+            )
+            self.console.print(
+                buffer.getvalue(),
+                markup=False,
+                highlight=False,
+                soft_wrap=True,
+                end="",
+            )
         else:
             # Single value or non-dict data
-            self.console.print(str(data))
+            self.console.print(str(data), markup=False, highlight=False, soft_wrap=True)
 
     def _print_value(self, data: Any) -> None:
         """Print data as raw values."""
         if isinstance(data, list):
-            for item in data:
-                self.console.print(str(item))
+            values: Iterable[Any] = data
         elif isinstance(data, dict):
-            for value in data.values():
-                self.console.print(str(value))
+            values = data.values()
         else:
-            self.console.print(str(data))
+            values = [data]
+        for value in values:
+            self.console.print(
+                str(value), markup=False, highlight=False, soft_wrap=True
+            )
 
     def _print_table_data(self, data: Any) -> None:
         """Print data in table format (fallback for complex data)."""
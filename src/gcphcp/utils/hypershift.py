@@ -1,5 +1,6 @@
 """Utilities for interacting with the hypershift CLI."""
 
+import functools
 import json
 import os
 import subprocess
@@ -29,6 +30,23 @@ SERVICE_ACCOUNTS = {
     "nodepool-mgmt": "Node Pool Management",
 }
 
+_SERVICE_ACCOUNT_KEYS = frozenset(SERVICE_ACCOUNTS)
+
+# Fields required in the JSON printed by hypershift create iam/infra gcp
+_IAM_CONFIG_FIELDS = frozenset(
+    {
+        "projectId",
+        "projectNumber",
+        "infraId",
+        "workloadIdentityPool",
+        "serviceAccounts",
+    }
+)
+_IAM_POOL_FIELDS = frozenset({"poolId", "providerId"})
+_INFRA_CONFIG_FIELDS = frozenset(
+    {"projectId", "infraId", "region", "networkName", "subnetName"}
+)
+
 # Error message for missing hypershift CLI
 HYPERSHIFT_NOT_FOUND_ERROR = (
     "hypershift CLI not found. Please install it or configure the path:\n"
@@ -87,16 +105,34 @@ def get_hypershift_binary(config=None) -> Optional[str]:
     Returns:
         Path to hypershift binary or None if not found
     """
-    # Check environment variable first
     env_binary = os.environ.get("HYPERSHIFT_BINARY")
+    config_binary = config.get_hypershift_binary() if config else None
+    return _resolve_hypershift_binary(env_binary, config_binary)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_hypershift_binary(
+    env_binary: Optional[str], config_binary: Optional[str]
+) -> Optional[str]:
+    """Resolve the hypershift binary from its configured candidates.
+
+    Results are cached so repeated lookups in one process skip the file
+    checks and the PATH search.
+
+    Args:
+        env_binary: Value of the HYPERSHIFT_BINARY environment variable
+        config_binary: hypershift_binary config setting
+
+    Returns:
+        Path to hypershift binary or None if not found
+    """
+    # Check environment variable first
     if env_binary and os.path.isfile(env_binary):
         return env_binary
 
     # Check config if provided
-    if config:
-        config_binary = config.get_hypershift_binary()
-        if config_binary and os.path.isfile(config_binary):
-            return config_binary
+    if config_binary and os.path.isfile(config_binary):
+        return config_binary
 
     # Check in PATH
     path_binary = shutil.which("hypershift")
@@ -208,30 +244,14 @@ def validate_iam_config(iam_config: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = [
-        "projectId",
-        "projectNumber",
-        "infraId",
-        "workloadIdentityPool",
-        "serviceAccounts",
-    ]
-
-    for field in required_fields:
-        if field not in iam_config:
-            return False
+    if not _IAM_CONFIG_FIELDS.issubset(iam_config):
+        return False
 
     # Check nested fields
-    if "poolId" not in iam_config.get("workloadIdentityPool", {}):
-        return False
-    if "providerId" not in iam_config.get("workloadIdentityPool", {}):
+    if not _IAM_POOL_FIELDS.issubset(iam_config["workloadIdentityPool"]):
         return False
 
-    service_accounts = iam_config.get("serviceAccounts", {})
-    for sa_key in SERVICE_ACCOUNTS:
-        if sa_key not in service_accounts:
-            return False
-
-    return True
+    return _SERVICE_ACCOUNT_KEYS.issubset(iam_config["serviceAccounts"])
 
 
 def iam_config_to_wif_spec(iam_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -355,19 +375,7 @@ def validate_infra_config(infra_config: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = [
-        "projectId",
-        "infraId",
-        "region",
-        "networkName",
-        "subnetName",
-    ]
-
-    for field in required_fields:
-        if field not in infra_config:
-            return False
-
-    return True
+    return _INFRA_CONFIG_FIELDS.issubset(infra_config)
 
 
 # =============================================================================
@@ -263,6 +263,45 @@ class TestAPIClient:
 
         assert "Request to" in str(exc_info.value)
 
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_conditional_get_reuses_data_on_not_modified(
+        self, mock_request, api_client
+    ):
+        """Test that a 304 response returns the previously fetched data."""
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.headers = {
+            "Content-Type": "application/json",
+            "ETag": '"v1"',
+        }
+        first_response.json.return_value = {"data": "cached"}
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mock_request.side_effect = [first_response, not_modified]
+
+        first = api_client.get("/test", conditional=True)
+        second = api_client.get("/test", conditional=True)
+
+        assert first == second == {"data": "cached"}
+        assert "If-None-Match" not in mock_request.call_args_list[0][1]["headers"]
+        assert mock_request.call_args_list[1][1]["headers"]["If-None-Match"] == '"v1"'
+
+    @patch("gcphcp.client.api_client.requests.Session.request")
+    def test_unconditional_get_sends_no_etag(self, mock_request, api_client):
+        """Test that plain GETs neither send nor record ETags."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json", "ETag": '"v1"'}
+        mock_response.json.return_value = {"data": "fresh"}
+        mock_request.return_value = mock_response
+
+        api_client.get("/test")
+        api_client.get("/test")
+
+        for call in mock_request.call_args_list:
+            assert "If-None-Match" not in call[1]["headers"]
+
     def test_get_method(self, api_client):
         """Test GET method."""
         with patch.object(api_client, "_make_request") as mock_request:
@@ -272,7 +311,11 @@ class TestAPIClient:
 
             assert result == {"result": "get"}
             mock_request.assert_called_once_with(
-                "GET", "/test", params={"key": "value"}, headers=None
+                "GET",
+                "/test",
+                params={"key": "value"},
+                headers=None,
+                conditional=False,
             )
 
     def test_post_method(self, api_client):
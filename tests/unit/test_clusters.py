@@ -0,0 +1,275 @@
+"""Unit tests for cluster commands."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from click import ClickException
+from click.testing import CliRunner
+
+from gcphcp.cli.commands._common import resolved_clusters
+from gcphcp.cli.commands.clusters import (
+    cluster_status,
+    resolve_cluster_identifier,
+)
+
+CLUSTERS = [
+    {"id": "abc12345-1234-1234-1234-123456789abc", "name": "prod"},
+    {"id": "abc12399-1234-1234-1234-123456789abc", "name": "staging"},
+    {"id": "def67890-1234-1234-1234-123456789abc", "name": "dev"},
+]
+
+
+class TestResolveClusterIdentifier:
+    """Test cases for resolve_cluster_identifier function."""
+
+    @pytest.fixture
+    def mock_api_client(self):
+        """Create a mock API client."""
+        client = MagicMock()
+        client.get.return_value = {"clusters": CLUSTERS}
+        return client
+
+    def test_name_resolves(self, mock_api_client):
+        """Test that an exact cluster name resolves to its ID."""
+        result = resolve_cluster_identifier(mock_api_client, "staging")
+
+        assert result == "abc12399-1234-1234-1234-123456789abc"
+        mock_api_client.get.assert_called_once_with(
+            "/api/v1/clusters", params={"limit": 100, "offset": 0}
+        )
+
+    def test_unique_prefix_resolves(self, mock_api_client):
+        """Test that a unique partial ID resolves to the full ID."""
+        result = resolve_cluster_identifier(mock_api_client, "def67890")
+
+        assert result == "def67890-1234-1234-1234-123456789abc"
+
+    def test_ambiguous_prefix_raises_error(self, mock_api_client):
+        """Test that a prefix matching several clusters raises an error."""
+        with pytest.raises(ClickException) as exc_info:
+            resolve_cluster_identifier(mock_api_client, "abc123")
+
+        error_message = str(exc_info.value.message)
+        assert "Multiple clusters match 'abc123'" in error_message
+        assert "(prod)" in error_message
+        assert "(staging)" in error_message
+
+    def test_not_found_raises_error(self, mock_api_client):
+        """Test that an unknown identifier raises an error."""
+        with pytest.raises(ClickException) as exc_info:
+            resolve_cluster_identifier(mock_api_client, "missing")
+
+        assert "No cluster found with identifier 'missing'" in str(
+            exc_info.value.message
+        )
+
+    def test_prefix_match_is_case_insensitive(self, mock_api_client):
+        """Test that partial IDs match regardless of case."""
+        result = resolve_cluster_identifier(mock_api_client, "DEF67890")
+
+        assert result == "def67890-1234-1234-1234-123456789abc"
+
+    def test_ambiguous_matches_keep_list_order(self, mock_api_client):
+        """Test that ambiguous matches are listed in API order."""
+        mock_api_client.get.return_value = {"clusters": CLUSTERS[1::-1]}
+
+        with pytest.raises(ClickException) as exc_info:
+            resolve_cluster_identifier(mock_api_client, "abc123")
+
+        error_message = str(exc_info.value.message)
+        assert error_message.index("(staging)") < error_message.index("(prod)")
+
+    def test_list_entry_is_not_kept(self, mock_api_client):
+        """Test that a cluster found in the list page is not reused."""
+        cluster_id = resolve_cluster_identifier(mock_api_client, "prod")
+
+        assert resolved_clusters.take(mock_api_client, cluster_id) is None
+
+    def test_full_uuid_fetch_is_remembered(self, mock_api_client):
+        """Test that a direct UUID lookup keeps the fetched cluster."""
+        cluster_id = "def67890-1234-1234-1234-123456789abc"
+        mock_api_client.get.return_value = {"id": cluster_id, "name": "dev"}
+
+        assert resolve_cluster_identifier(mock_api_client, cluster_id) == cluster_id
+        assert resolved_clusters.take(mock_api_client, cluster_id)["name"] == "dev"
+        assert resolved_clusters.take(mock_api_client, cluster_id) is None
+        mock_api_client.get.assert_called_once_with(f"/api/v1/clusters/{cluster_id}")
+
+    def test_uuid_shaped_name_is_not_fetched_directly(self, mock_api_client):
+        """Test that a UUID-shaped non-hex identifier skips the direct lookup."""
+        identifier = "ghijklmn-opqr-stuv-wxyz-ghijklmnopqr"
+        assert len(identifier) == 36 and identifier.count("-") == 4
+
+        with pytest.raises(ClickException):
+            resolve_cluster_identifier(mock_api_client, identifier)
+
+        mock_api_client.get.assert_called_once_with(
+            "/api/v1/clusters", params={"limit": 100, "offset": 0}
+        )
+
+    def test_full_pages_are_followed(self, mock_api_client):
+        """Test that clusters beyond the first page are found."""
+        first_page = [
+            {"id": f"{i:08d}-0000-0000-0000-000000000000", "name": f"c{i}"}
+            for i in range(100)
+        ]
+        mock_api_client.get.side_effect = [
+            {"clusters": first_page},
+            {"clusters": [CLUSTERS[2]]},
+        ]
+
+        result = resolve_cluster_identifier(mock_api_client, "dev")
+
+        assert result == "def67890-1234-1234-1234-123456789abc"
+        assert mock_api_client.get.call_args_list[1].kwargs["params"] == {
+            "limit": 100,
+            "offset": 100,
+        }
+
+    def test_name_on_later_page_wins_over_id_prefix(self, mock_api_client):
+        """Test that an exact name beats a partial ID match on an earlier page."""
+        first_page = [
+            {"id": f"{i:08d}-0000-0000-0000-000000000000", "name": f"c{i}"}
+            for i in range(100)
+        ]
+        mock_api_client.get.side_effect = [
+            {"clusters": first_page},
+            {"clusters": [{"id": CLUSTERS[2]["id"], "name": "00000042"}]},
+        ]
+
+        result = resolve_cluster_identifier(mock_api_client, "00000042")
+
+        assert result == CLUSTERS[2]["id"]
+
+    def test_paging_stops_at_reported_total(self, mock_api_client):
+        """Test that a full page covering the total ends the listing."""
+        page = [
+            {"id": f"{i:08d}-0000-0000-0000-000000000000", "name": f"c{i}"}
+            for i in range(100)
+        ]
+        mock_api_client.get.return_value = {"clusters": page, "total": 100}
+
+        with pytest.raises(ClickException):
+            resolve_cluster_identifier(mock_api_client, "missing")
+
+        mock_api_client.get.assert_called_once()
+
+    def test_name_lookup_stops_at_matching_page(self, mock_api_client):
+        """Test that an exact name hit does not fetch the remaining pages."""
+        first_page = [
+            {"id": f"{i:08d}-0000-0000-0000-000000000000", "name": f"c{i}"}
+            for i in range(100)
+        ]
+        mock_api_client.get.side_effect = [
+            {"clusters": first_page},
+            {"clusters": [CLUSTERS[2]]},
+        ]
+
+        result = resolve_cluster_identifier(mock_api_client, "c42")
+
+        assert result == "00000042-0000-0000-0000-000000000000"
+        mock_api_client.get.assert_called_once()
+
+
+class TestClusterStatusWatch:
+    """Test cases for clusters status --watch polling."""
+
+    @pytest.fixture
+    def cli_context(self):
+        """Create a mock CLI context with JSON output."""
+        context = MagicMock()
+        context.output_format = "json"
+        context.quiet = False
+        return context
+
+    def _watch_delays(self, cli_context, phases, interval=2):
+        """Run the watch loop over a sequence of phases and collect sleeps."""
+        cluster_id = "abc12345-1234-1234-1234-123456789abc"
+        responses = iter(phases)
+
+        def fake_get(path, params=None, conditional=False):
+            if path == f"/api/v1/clusters/{cluster_id}":
+                return {"id": cluster_id, "status": {"phase": next(responses)}}
+            return {"nodepools": []}
+
+        cli_context.get_api_client.return_value.get.side_effect = fake_get
+        delays = []
+
+        def fake_sleep(seconds):
+            delays.append(seconds)
+            if len(delays) == len(phases):
+                raise KeyboardInterrupt
+
+        with patch("time.sleep", side_effect=fake_sleep):
+            result = CliRunner().invoke(
+                cluster_status,
+                [cluster_id, "--watch", "--interval", str(interval)],
+                obj=cli_context,
+            )
+
+        assert result.exit_code == 0, result.output
+        return delays
+
+    def test_interval_doubles_while_unchanged(self, cli_context):
+        """Test that polling backs off while the phase stays the same."""
+        delays = self._watch_delays(cli_context, ["Progressing"] * 4)
+
+        assert delays == [2, 4, 8, 16]
+
+    def test_interval_resets_on_phase_change(self, cli_context):
+        """Test that a phase change restores the base interval."""
+        delays = self._watch_delays(
+            cli_context, ["Progressing", "Progressing", "Ready", "Ready"]
+        )
+
+        assert delays == [2, 4, 2, 4]
+
+    def test_interval_is_capped(self, cli_context):
+        """Test that backoff never exceeds the maximum interval."""
+        delays = self._watch_delays(cli_context, ["Progressing"] * 8)
+
+        assert max(delays) == 60
+
+    def test_cap_does_not_scale_with_interval(self, cli_context):
+        """Test that longer base intervals back off to the same fixed cap."""
+        delays = self._watch_delays(cli_context, ["Progressing"] * 5, interval=10)
+
+        assert delays == [10, 20, 40, 60, 60]
+
+    def test_interval_above_cap_is_not_backed_off(self, cli_context):
+        """Test that a base interval above the cap is used as-is."""
+        delays = self._watch_delays(cli_context, ["Progressing"] * 3, interval=90)
+
+        assert delays == [90, 90, 90]
+
+    def test_unchanged_table_is_not_redrawn(self, cli_context):
+        """Test that table output is only re-rendered when data changes."""
+        cli_context.output_format = "table"
+        cli_context.console.is_terminal = False
+
+        self._watch_delays(cli_context, ["Progressing", "Progressing", "Ready"])
+
+        assert cli_context.formatter.print_cluster_status.call_count == 2
+
+
+class TestClusterStatus:
+    """Test cases for one-shot clusters status output."""
+
+    def test_missing_status_outputs_a_fresh_dict(self):
+        """Test that a cluster without status reports an empty, writable dict."""
+        cluster_id = "abc12345-1234-1234-1234-123456789abc"
+        context = MagicMock()
+        context.output_format = "json"
+        context.get_api_client.return_value.get.side_effect = lambda path, **_: (
+            {"id": cluster_id, "name": "prod"}
+            if path == f"/api/v1/clusters/{cluster_id}"
+            else {"nodepools": []}
+        )
+
+        for _ in range(2):
+            result = CliRunner().invoke(cluster_status, [cluster_id], obj=context)
+
+            assert result.exit_code == 0, result.output
+            (status_data,) = context.formatter.print_data.call_args.args
+            assert status_data["status"] == {}
+            # Callers may add to the output without leaking into later runs
+            status_data["status"]["phase"] = "Ready"
@@ -11,6 +11,7 @@ from gcphcp.utils.crypto import (
     public_key_to_jwks,
     base64_encode_pem,
     generate_cluster_keypair,
+    signing_key_matches_jwks,
 )
 
 
@@ -189,3 +190,34 @@ class TestGenerateClusterKeypair:
             assert decoded == result.private_key_pem
         finally:
             result.cleanup()
+
+    def test_generate_cluster_keypair_without_jwks_file(self):
+        """When the JWKS file is skipped the JWKS should only be in memory."""
+        result = generate_cluster_keypair(write_jwks_file=False)
+
+        assert result.jwks_file_path == ""
+        jwks = json.loads(result.jwks_json)
+        assert jwks["keys"][0]["kid"] == result.kid
+        result.cleanup()
+
+
+class TestSigningKeyMatchesJwks:
+    """Tests for signing_key_matches_jwks function."""
+
+    def test_signing_key_matches_its_own_jwks(self):
+        """When the JWKS was built from the key it should match."""
+        private_key, public_key = generate_keypair()
+        jwks_json, _ = public_key_to_jwks(public_key)
+
+        assert signing_key_matches_jwks(private_key_to_pem(private_key), jwks_json)
+
+    def test_signing_key_does_not_match_other_jwks(self):
+        """When the JWKS holds another key or is not JSON it should not match."""
+        private_key, _ = generate_keypair()
+        _, other_public_key = generate_keypair()
+        other_jwks, _ = public_key_to_jwks(other_public_key)
+        pem = private_key_to_pem(private_key)
+
+        assert not signing_key_matches_jwks(pem, other_jwks)
+        assert not signing_key_matches_jwks(pem, "not json")
+        assert not signing_key_matches_jwks(pem, '{"keys": null}')
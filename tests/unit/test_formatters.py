@@ -1,162 +1,234 @@
 """Unit tests for output formatters."""
 
+import csv
 import json
 from io import StringIO
 
+import pytest
+import yaml
+
 from gcphcp.utils.formatters import OutputFormatter
 
+# Cluster status with multi-line messages, as reported in GCP-269
+_GCP269_DATA = {
+    "cluster_id": "test-cluster",
+    "cluster_name": "test-cluster-name",
+    "status": {
+        "phase": "Progressing",
+        "message": (
+            "Controllers are provisioning resources "
+            "(19 minutes remaining) (1\ncontrollers working)"
+        ),
+        "conditions": [
+            {
+                "type": "Available",
+                "status": "False",
+                "message": "Multi-line message\nwith newlines",
+                "lastTransitionTime": "2025-12-04T10:00:00Z",
+            }
+        ],
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def json_formatter():
+    """Provide one JSON formatter shared by the JSON output tests."""
+    return OutputFormatter(format_type="json")
+
+
+@pytest.fixture
+def json_output(json_formatter):
+    """Point the shared JSON formatter at a fresh output buffer."""
+    output_buffer = StringIO()
+    json_formatter.console.file = output_buffer
+    return output_buffer
+
 
 class TestOutputFormatter:
     """Tests for OutputFormatter class."""
 
-    def test_json_output_escapes_newlines(self):
+    @pytest.mark.parametrize(
+        "test_data,escapes",
+        [
+            pytest.param(_GCP269_DATA, ["\\n"], id="cluster-status"),
+            pytest.param(
+                {"message": "Line1\nLine2\rLine3\tTabbed\x00Null\x1fControl"},
+                ["\\n", "\\r", "\\t", "\\u0000", "\\u001f"],
+                id="control-characters",
+            ),
+            pytest.param(
+                {"message": "Hello 世界 🌍", "emoji": "✅ ❌ ⚠️"},
+                [],
+                id="unicode",
+            ),
+            pytest.param(
+                {
+                    "level1": {
+                        "level2": {
+                            "level3": {"message": "Deep\nnesting\nwith\nnewlines"}
+                        }
+                    }
+                },
+                ["\\n"],
+                id="nested",
+            ),
+            pytest.param(
+                [
+                    {"id": 1, "message": "First\nmessage"},
+                    {"id": 2, "message": "Second\nmessage"},
+                ],
+                ["\\n"],
+                id="list-of-objects",
+            ),
+        ],
+    )
+    def test_json_output_round_trips(
+        self, json_formatter, json_output, test_data, escapes
+    ):
+        """Test that JSON output loads back to the same data, escaped."""
+        json_formatter.print_data(test_data)
+        output = json_output.getvalue()
+
+        assert json.loads(output) == test_data
+        for escape in escapes:
+            assert escape in output
+
+    def test_json_output_escapes_newlines(self, json_formatter, json_output):
         """Test that JSON output properly escapes newline characters.
 
         This is a regression test for GCP-269 where JSON output contained
         literal newline characters instead of escaped \\n sequences.
         """
-        # Create test data that mimics cluster status with newlines
-        test_data = {
-            "cluster_id": "test-cluster",
-            "cluster_name": "test-cluster-name",
-            "status": {
-                "phase": "Progressing",
-                "message": (
-                    "Controllers are provisioning resources "
-                    "(19 minutes remaining) (1\ncontrollers working)"
-                ),
-                "conditions": [
-                    {
-                        "type": "Available",
-                        "status": "False",
-                        "message": "Multi-line message\nwith newlines",
-                        "lastTransitionTime": "2025-12-04T10:00:00Z",
-                    }
-                ],
-            },
-        }
-
-        # Capture output
-        output_buffer = StringIO()
-        formatter = OutputFormatter(format_type="json")
-        formatter.console.file = output_buffer
-
-        # Print the data
-        formatter.print_data(test_data)
+        json_formatter.print_data(_GCP269_DATA)
+        output = json_output.getvalue()
 
-        # Get the output
-        json_output = output_buffer.getvalue()
-
-        # Verify the output is valid JSON
-        parsed = json.loads(json_output)
-        expected_msg = test_data["status"]["message"]  # type: ignore[index]
-        actual_msg = parsed["status"]["message"]
-        assert actual_msg == expected_msg
-
-        # Verify newlines are properly escaped in raw JSON string
         # The raw JSON should contain \\n (escaped) not literal newlines
-        assert "\\n" in json_output, "JSON should contain escaped newlines (\\n)"
-
-        # Ensure there are no literal newlines within JSON string values
-        # Split by newlines and check that each line (except last) ends with valid JSON
-        lines = json_output.rstrip("\n").split("\n")
-        # The JSON is indented, so we expect multiple lines for formatting
-        # But within string values, there should be no literal newlines
+        assert "\\n" in output, "JSON should contain escaped newlines (\\n)"
 
         # Key test: the message field should have \\n not a literal newline
-        # Find the line with the message
-        message_lines = [line for line in lines if "controllers working" in line]
-        assert len(message_lines) == 1, (
+        index = output.find("controllers working")
+        assert index != -1
+        line_start = output.rfind("\n", 0, index) + 1
+        line_end = output.find("\n", index)
+        assert "(1\\ncontrollers working)" in output[line_start:line_end], (
             "Message with newline should appear on a single line in JSON, "
             "not split across multiple lines"
         )
 
-    def test_json_output_escapes_control_characters(self):
-        """Test that JSON output escapes various control characters."""
+    def test_json_encode_failure_writes_no_partial_document(
+        self, json_formatter, json_output
+    ):
+        """Test that data failing to encode never leaves half a JSON document."""
+        test_data = {"items": [1, 2]}
+        test_data["items"].append(test_data)
+
+        json_formatter.print_data(test_data)
+
+        assert '"items"' not in json_output.getvalue()
+
+    def test_yaml_output_round_trips(self):
+        """Test that YAML output loads back to the same data."""
         test_data = {
-            "message": "Line1\nLine2\rLine3\tTabbed\x00Null\x1fControl",
+            "cluster_id": "test-cluster",
+            "status": {"phase": "Ready", "message": "Line one\nline two ✓"},
+            "nodepools": [{"name": "workers", "replicas": 3}],
         }
-
         output_buffer = StringIO()
-        formatter = OutputFormatter(format_type="json")
+        formatter = OutputFormatter(format_type="yaml")
         formatter.console.file = output_buffer
 
         formatter.print_data(test_data)
-        json_output = output_buffer.getvalue()
 
-        # Should be valid JSON
-        parsed = json.loads(json_output)
-        assert parsed["message"] == test_data["message"]
-
-        # Should contain escape sequences
-        assert "\\n" in json_output
-        assert "\\r" in json_output
-        assert "\\t" in json_output
-
-    def test_json_output_handles_unicode(self):
-        """Test that JSON output handles Unicode characters correctly."""
-        test_data = {
-            "message": "Hello 世界 🌍",
-            "emoji": "✅ ❌ ⚠️",
-        }
+        assert yaml.safe_load(output_buffer.getvalue()) == test_data
 
+    def test_yaml_output_handles_tuples(self):
+        """Test that tuple values are dumped as YAML rather than a repr."""
+        test_data = {"zones": ("us-central1-a", "us-central1-b")}
         output_buffer = StringIO()
-        formatter = OutputFormatter(format_type="json")
+        formatter = OutputFormatter(format_type="yaml")
         formatter.console.file = output_buffer
 
         formatter.print_data(test_data)
-        json_output = output_buffer.getvalue()
-
-        # Should be valid JSON
-        parsed = json.loads(json_output)
-        assert parsed["message"] == test_data["message"]
-        assert parsed["emoji"] == test_data["emoji"]
-
-    def test_json_output_handles_nested_structures(self):
-        """Test that JSON output handles deeply nested structures."""
-        test_data = {
-            "level1": {
-                "level2": {
-                    "level3": {
-                        "message": "Deep\nnesting\nwith\nnewlines",
-                    }
-                }
-            }
-        }
 
+        output = output_buffer.getvalue()
+        assert output.startswith("zones: !!python/tuple\n")
+        assert yaml.unsafe_load(output) == test_data
+
+    def test_yaml_and_value_output_skip_markup(self):
+        """Test that bracketed text is not treated as Rich markup."""
+        test_data = {"message": "[bold]not markup[/bold]"}
+        for format_type, expected in (
+            ("yaml", "message: '[bold]not markup[/bold]'\n"),
+            ("value", "[bold]not markup[/bold]\n"),
+        ):
+            output_buffer = StringIO()
+            formatter = OutputFormatter(format_type=format_type)
+            formatter.console.file = output_buffer
+
+            formatter.print_data(test_data)
+
+            assert output_buffer.getvalue().startswith(expected)
+
+    def test_csv_output_quotes_fields(self):
+        """Test that CSV output quotes special characters and skips markup."""
+        test_data = [
+            {"name": "a,b", "message": 'say "hi"\nthen [red]stop[/red]'},
+            {"name": "plain", "message": None},
+        ]
         output_buffer = StringIO()
-        formatter = OutputFormatter(format_type="json")
+        formatter = OutputFormatter(format_type="csv")
         formatter.console.file = output_buffer
 
         formatter.print_data(test_data)
-        json_output = output_buffer.getvalue()
 
-        # Should be valid JSON
-        parsed = json.loads(json_output)
-        assert (
-            parsed["level1"]["level2"]["level3"]["message"]
-            == test_data["level1"]["level2"]["level3"]["message"]
+        rows = list(csv.reader(StringIO(output_buffer.getvalue())))
+        assert rows == [
+            ["name", "message"],
+            ["a,b", 'say "hi"\nthen [red]stop[/red]'],
+            ["plain", "None"],
+        ]
+
+    def test_format_datetime(self):
+        """Test that ISO timestamps format as UTC and bad input passes through."""
+        formatter = OutputFormatter()
+
+        assert formatter.format_datetime("2025-12-04T10:00:00Z") == (
+            "2025-12-04 10:00:00 UTC"
         )
+        assert formatter.format_datetime("not a date") == "not a date"
+        assert formatter.format_datetime(None) == ""
 
-    def test_json_output_with_list_of_objects(self):
-        """Test JSON output with lists containing objects with newlines."""
-        test_data = [
-            {"id": 1, "message": "First\nmessage"},
-            {"id": 2, "message": "Second\nmessage"},
-        ]
+    def test_empty_table_keeps_notice_in_every_format(self):
+        """Test that empty table data prints the notice, not an empty document."""
+        for format_type in ("table", "json", "yaml", "csv"):
+            output_buffer = StringIO()
+            formatter = OutputFormatter(format_type=format_type)
+            formatter.console.file = output_buffer
 
+            formatter.print_table([], title="Clusters")
+
+            assert output_buffer.getvalue() == "No data found for Clusters\n"
+
+    def test_table_rows_render_in_column_order(self):
+        """Test that pre-ordered rows render under the given columns."""
         output_buffer = StringIO()
-        formatter = OutputFormatter(format_type="json")
+        formatter = OutputFormatter(format_type="table")
         formatter.console.file = output_buffer
 
-        formatter.print_data(test_data)
-        json_output = output_buffer.getvalue()
-
-        # Should be valid JSON
-        parsed = json.loads(json_output)
-        assert len(parsed) == 2
-        assert parsed[0]["message"] == "First\nmessage"
-        assert parsed[1]["message"] == "Second\nmessage"
+        formatter.print_table_rows(
+            [("prod", "Ready", 3), ("dev", "Progressing", None)],
+            columns=["NAME", "STATUS", "NODES"],
+            title="Clusters",
+        )
+        lines = output_buffer.getvalue().splitlines()
+
+        header = next(line for line in lines if "NAME" in line)
+        assert header.index("NAME") < header.index("STATUS") < header.index("NODES")
+        prod = next(line for line in lines if "prod" in line)
+        assert "Ready" in prod and "3" in prod
+        dev = next(line for line in lines if "dev" in line)
+        assert "Progressing" in dev and "None" in dev
 
 
 class TestControllerStatusDisplay:
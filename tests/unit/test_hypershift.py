@@ -1,7 +1,7 @@
 """Unit tests for hypershift utilities."""
 
-import os
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import subprocess
 
@@ -18,63 +18,99 @@ from gcphcp.utils.hypershift import (
     destroy_infra_gcp,
     SERVICE_ACCOUNTS,
     MAX_INFRA_ID_LENGTH,
+    _resolve_hypershift_binary,
 )
 
+# A complete WIF config as printed by hypershift create iam gcp
+_VALID_WIF = {
+    "projectId": "my-project",
+    "projectNumber": "123456789",
+    "infraId": "my-infra",
+    "workloadIdentityPool": {
+        "poolId": "my-pool",
+        "providerId": "my-provider",
+    },
+    "serviceAccounts": {
+        "ctrlplane-op": "sa1@example.com",
+        "nodepool-mgmt": "sa2@example.com",
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_hypershift_binary_cache():
+    """Reset the cached hypershift binary lookup between tests."""
+    _resolve_hypershift_binary.cache_clear()
+    yield
+    _resolve_hypershift_binary.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Run every test without a HYPERSHIFT_BINARY override."""
+    monkeypatch.delenv("HYPERSHIFT_BINARY", raising=False)
+
 
 class TestGetHypershiftBinary:
     """Tests for get_hypershift_binary function."""
 
-    def test_get_hypershift_binary_from_env(self, tmp_path):
+    @pytest.fixture
+    def which_mock(self):
+        """Patch shutil.which; tests set the PATH lookup result."""
+        with patch("shutil.which") as mock_which:
+            yield mock_which
+
+    def test_get_hypershift_binary_from_env(self, monkeypatch):
         """When HYPERSHIFT_BINARY env is set it should return that path."""
-        binary_path = tmp_path / "hypershift"
-        binary_path.touch()
+        monkeypatch.setenv("HYPERSHIFT_BINARY", "/fake/hypershift")
 
-        with patch.dict(os.environ, {"HYPERSHIFT_BINARY": str(binary_path)}):
+        with patch("os.path.isfile", return_value=True):
             result = get_hypershift_binary()
 
-        assert result == str(binary_path)
+        assert result == "/fake/hypershift"
 
-    def test_get_hypershift_binary_env_not_file(self, tmp_path):
+    def test_get_hypershift_binary_env_not_file(self, monkeypatch, which_mock):
         """When HYPERSHIFT_BINARY points to non-file it should check config."""
-        with patch.dict(os.environ, {"HYPERSHIFT_BINARY": "/nonexistent/path"}):
-            with patch("shutil.which", return_value=None):
-                result = get_hypershift_binary()
+        monkeypatch.setenv("HYPERSHIFT_BINARY", "/nonexistent/path")
+        which_mock.return_value = None
+
+        result = get_hypershift_binary()
 
         assert result is None
 
-    def test_get_hypershift_binary_from_config(self, tmp_path):
+    def test_get_hypershift_binary_from_config(self):
         """When config has hypershift_binary it should return that path."""
-        binary_path = tmp_path / "hypershift"
-        binary_path.touch()
-
-        mock_config = MagicMock()
-        mock_config.get_hypershift_binary.return_value = str(binary_path)
+        mock_config = SimpleNamespace(get_hypershift_binary=lambda: "/fake/hypershift")
 
-        with patch.dict(os.environ, {}, clear=True):
-            # Clear HYPERSHIFT_BINARY if set
-            os.environ.pop("HYPERSHIFT_BINARY", None)
+        with patch("os.path.isfile", return_value=True):
             result = get_hypershift_binary(config=mock_config)
 
-        assert result == str(binary_path)
+        assert result == "/fake/hypershift"
 
-    def test_get_hypershift_binary_from_path(self):
+    def test_get_hypershift_binary_from_path(self, which_mock):
         """When hypershift is in PATH it should return that path."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("HYPERSHIFT_BINARY", None)
-            with patch("shutil.which", return_value="/usr/local/bin/hypershift"):
-                result = get_hypershift_binary()
+        which_mock.return_value = "/usr/local/bin/hypershift"
+
+        result = get_hypershift_binary()
 
         assert result == "/usr/local/bin/hypershift"
 
-    def test_get_hypershift_binary_not_found(self):
+    def test_get_hypershift_binary_not_found(self, which_mock):
         """When hypershift is not found it should return None."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("HYPERSHIFT_BINARY", None)
-            with patch("shutil.which", return_value=None):
-                result = get_hypershift_binary()
+        which_mock.return_value = None
+
+        result = get_hypershift_binary()
 
         assert result is None
 
+    def test_get_hypershift_binary_caches_path_lookup(self, which_mock):
+        """Repeated lookups should search PATH only once."""
+        which_mock.return_value = "/usr/local/bin/hypershift"
+
+        assert get_hypershift_binary() == "/usr/local/bin/hypershift"
+        assert get_hypershift_binary() == "/usr/local/bin/hypershift"
+        which_mock.assert_called_once_with("hypershift")
+
 
 class TestCheckHypershiftInstalled:
     """Tests for check_hypershift_installed function."""
@@ -96,75 +132,31 @@ class TestCheckHypershiftInstalled:
 class TestValidateWifConfig:
     """Tests for validate_iam_config function."""
 
-    def test_validate_iam_config_valid(self):
-        """When WIF config has all required fields it should return True."""
-        valid_config = {
-            "projectId": "my-project",
-            "projectNumber": "123456789",
-            "infraId": "my-infra",
-            "workloadIdentityPool": {
-                "poolId": "my-pool",
-                "providerId": "my-provider",
-            },
-            "serviceAccounts": {
-                "ctrlplane-op": "sa1@example.com",
-                "nodepool-mgmt": "sa2@example.com",
-            },
-        }
-
-        assert validate_iam_config(valid_config) is True
-
-    def test_validate_iam_config_missing_project_id(self):
-        """When WIF config is missing projectId it should return False."""
-        invalid_config = {
-            "projectNumber": "123456789",
-            "infraId": "my-infra",
-            "workloadIdentityPool": {
-                "poolId": "my-pool",
-                "providerId": "my-provider",
-            },
-            "serviceAccounts": {
-                "ctrlplane-op": "sa1@example.com",
-                "nodepool-mgmt": "sa2@example.com",
-            },
-        }
-
-        assert validate_iam_config(invalid_config) is False
-
-    def test_validate_iam_config_missing_pool_id(self):
-        """When WIF config is missing poolId it should return False."""
-        invalid_config = {
-            "projectId": "my-project",
-            "projectNumber": "123456789",
-            "infraId": "my-infra",
-            "workloadIdentityPool": {
-                "providerId": "my-provider",
-            },
-            "serviceAccounts": {
-                "ctrlplane-op": "sa1@example.com",
-                "nodepool-mgmt": "sa2@example.com",
-            },
-        }
-
-        assert validate_iam_config(invalid_config) is False
-
-    def test_validate_iam_config_missing_service_account(self):
-        """When WIF config is missing service account it should return False."""
-        invalid_config = {
-            "projectId": "my-project",
-            "projectNumber": "123456789",
-            "infraId": "my-infra",
-            "workloadIdentityPool": {
-                "poolId": "my-pool",
-                "providerId": "my-provider",
-            },
-            "serviceAccounts": {
-                "ctrlplane-op": "sa1@example.com",
-                # Missing nodepool-mgmt
-            },
-        }
-
-        assert validate_iam_config(invalid_config) is False
+    @pytest.mark.parametrize(
+        "section,missing_key,expected",
+        [
+            pytest.param(None, None, True, id="valid"),
+            pytest.param(None, "projectId", False, id="missing-project-id"),
+            pytest.param("workloadIdentityPool", "poolId", False, id="missing-pool-id"),
+            pytest.param(
+                "serviceAccounts", "nodepool-mgmt", False, id="missing-service-account"
+            ),
+        ],
+    )
+    def test_validate_iam_config(self, section, missing_key, expected):
+        """A WIF config should be valid only when no required field is missing."""
+        # Copy only the level that loses a key; _VALID_WIF stays untouched
+        config = dict(_VALID_WIF)
+        if section:
+            config[section] = {
+                key: value
+                for key, value in _VALID_WIF[section].items()
+                if key != missing_key
+            }
+        elif missing_key:
+            del config[missing_key]
+
+        assert validate_iam_config(config) is expected
 
     def test_validate_iam_config_empty(self):
         """When WIF config is empty it should return False."""
@@ -176,28 +168,15 @@ class TestWifConfigToClusterSpec:
 
     def test_iam_config_to_wif_spec_conversion(self):
         """When converting WIF config it should produce correct cluster spec."""
-        wif_config = {
-            "projectId": "my-project",
-            "projectNumber": "123456789",
-            "infraId": "my-infra",
-            "workloadIdentityPool": {
-                "poolId": "my-pool",
-                "providerId": "my-provider",
-            },
-            "serviceAccounts": {
-                "ctrlplane-op": "ctrlplane@example.com",
-                "nodepool-mgmt": "nodepool@example.com",
-            },
-        }
-
-        result = iam_config_to_wif_spec(wif_config)
+        result = iam_config_to_wif_spec(_VALID_WIF)
 
         assert result["projectNumber"] == "123456789"
         assert result["poolID"] == "my-pool"
         assert result["providerID"] == "my-provider"
-        ctrl_email = result["serviceAccountsRef"]["controlPlaneEmail"]
-        assert ctrl_email == "ctrlplane@example.com"
-        assert result["serviceAccountsRef"]["nodePoolEmail"] == "nodepool@example.com"
+        assert result["serviceAccountsRef"] == {
+            "controlPlaneEmail": "sa1@example.com",
+            "nodePoolEmail": "sa2@example.com",
+        }
 
     def test_iam_config_to_wif_spec_empty_config(self):
         """When converting empty config it should return None values."""
@@ -222,15 +201,14 @@ class TestHypershiftError:
 class TestRequireHypershiftBinary:
     """Tests for require_hypershift_binary function."""
 
-    def test_require_hypershift_binary_found(self, tmp_path):
+    def test_require_hypershift_binary_found(self, monkeypatch):
         """When hypershift is found it should return the path."""
-        binary_path = tmp_path / "hypershift"
-        binary_path.touch()
+        monkeypatch.setenv("HYPERSHIFT_BINARY", "/fake/hypershift")
 
-        with patch.dict(os.environ, {"HYPERSHIFT_BINARY": str(binary_path)}):
+        with patch("os.path.isfile", return_value=True):
             result = require_hypershift_binary()
 
-        assert result == str(binary_path)
+        assert result == "/fake/hypershift"
 
     def test_require_hypershift_binary_not_found(self):
         """When hypershift is not found it should raise HypershiftError."""
@@ -0,0 +1,267 @@
+"""Unit tests for infra commands."""
+
+import json
+import os
+import stat
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+from cryptography.hazmat.primitives.asymmetric import rsa
+from rich.console import Console
+
+from gcphcp.cli.commands.infra import (
+    _serialize_config,
+    _write_file_atomic,
+    create_infra,
+)
+from gcphcp.utils.crypto import (
+    KeypairResult,
+    private_key_to_pem,
+    public_key_to_jwks,
+)
+from gcphcp.utils.hypershift import HypershiftError
+
+# Configs shaped like the JSON printed by hypershift create iam/infra gcp
+_IAM_CONFIG = {
+    "projectId": "my-project",
+    "projectNumber": "123456789",
+    "infraId": "my-infra",
+    "workloadIdentityPool": {"poolId": "my-pool", "providerId": "my-provider"},
+    "serviceAccounts": {
+        "ctrlplane-op": "sa1@example.com",
+        "nodepool-mgmt": "sa2@example.com",
+    },
+}
+_INFRA_CONFIG = {
+    "projectId": "my-project",
+    "infraId": "my-infra",
+    "region": "us-central1",
+    "networkName": "my-infra-network",
+    "subnetName": "my-infra-subnet",
+}
+
+
+def _make_keypair():
+    """Build a KeypairResult from a small RSA key to keep tests fast."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwks_json, kid = public_key_to_jwks(private_key.public_key())
+    return KeypairResult(
+        private_key_pem=private_key_to_pem(private_key),
+        private_key_pem_base64="",
+        jwks_file_path="",
+        kid=kid,
+        jwks_json=jwks_json,
+    )
+
+
+@pytest.fixture(scope="module")
+def keypair():
+    """Provide one generated keypair for the module."""
+    return _make_keypair()
+
+
+@pytest.fixture
+def context():
+    """Create a CLI context whose console writes to a buffer."""
+    cli_context = MagicMock()
+    cli_context.quiet = False
+    cli_context.console = Console(file=StringIO(), width=120)
+    return cli_context
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the command inside a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _invoke(context, *extra_args):
+    """Run infra create for my-infra with the given extra arguments."""
+    return CliRunner().invoke(
+        create_infra, ["my-infra", "--project", "my-project", *extra_args], obj=context
+    )
+
+
+class TestCreateInfra:
+    """Tests for infra create command."""
+
+    @pytest.fixture
+    def steps(self, keypair):
+        """Patch keygen and both hypershift steps, recording their order."""
+        calls = []
+
+        def record(name, value):
+            def step(*args, **kwargs):
+                calls.append(name)
+                return value
+
+            return step
+
+        with patch(
+            "gcphcp.cli.commands.infra.generate_cluster_keypair",
+            side_effect=record("keygen", keypair),
+        ) as mock_generate, patch(
+            "gcphcp.cli.commands.infra.create_iam_gcp",
+            side_effect=record("iam", _IAM_CONFIG),
+        ) as mock_iam, patch(
+            "gcphcp.cli.commands.infra.create_infra_gcp",
+            side_effect=record("infra", _INFRA_CONFIG),
+        ) as mock_infra:
+            yield SimpleNamespace(
+                calls=calls, generate=mock_generate, iam=mock_iam, infra=mock_infra
+            )
+
+    def test_creates_keys_iam_and_network_in_order(self, context, workdir, steps):
+        """The happy path should run every step in order and save all files."""
+        result = _invoke(context)
+
+        assert result.exit_code == 0, result.output
+        assert steps.calls == ["keygen", "iam", "infra"]
+        assert steps.iam.call_args.kwargs["oidc_jwks_file"] == "my-infra-jwks.json"
+        assert json.loads((workdir / "my-infra-iam-config.json").read_text()) == (
+            _IAM_CONFIG
+        )
+        assert json.loads((workdir / "my-infra-infra-config.json").read_text()) == (
+            _INFRA_CONFIG
+        )
+        assert "All infrastructure created successfully" in (
+            context.console.file.getvalue()
+        )
+
+    def test_signing_key_is_private(self, context, workdir, steps, keypair):
+        """The saved signing key should be readable by the owner only."""
+        result = _invoke(context)
+
+        assert result.exit_code == 0, result.output
+        key_file = workdir / "my-infra-signing-key.pem"
+        assert key_file.read_text() == keypair.private_key_pem
+        assert stat.S_IMODE(key_file.stat().st_mode) == 0o600
+        assert (workdir / "my-infra-jwks.json").read_text() == keypair.jwks_json
+
+    def test_compact_json_writes_unindented_configs(self, context, workdir, steps):
+        """--compact-json should save configs without whitespace."""
+        result = _invoke(context, "--compact-json")
+
+        assert result.exit_code == 0, result.output
+        saved = (workdir / "my-infra-iam-config.json").read_text()
+        assert saved == json.dumps(_IAM_CONFIG, separators=(",", ":"))
+
+    def test_keygen_failure_stops_before_cloud_steps(self, context, workdir, steps):
+        """A keygen failure should not create IAM or network resources."""
+        steps.generate.side_effect = RuntimeError("no entropy")
+
+        result = _invoke(context)
+
+        assert result.exit_code == 1
+        assert "Failed to generate keypair: no entropy" in result.output
+        steps.iam.assert_not_called()
+        steps.infra.assert_not_called()
+
+    def test_iam_failure_leaves_no_network_behind(self, context, workdir, steps):
+        """An IAM failure should stop the command before the network step."""
+        steps.iam.side_effect = HypershiftError("iam boom")
+
+        result = _invoke(context)
+
+        assert result.exit_code == 1
+        assert "iam boom" in result.output
+        steps.infra.assert_not_called()
+        assert not (workdir / "my-infra-iam-config.json").exists()
+
+    def test_invalid_iam_config_leaves_no_network_behind(self, context, workdir, steps):
+        """An incomplete IAM config should stop the command before the network."""
+        steps.iam.side_effect = None
+        steps.iam.return_value = {"projectId": "my-project"}
+
+        result = _invoke(context)
+
+        assert result.exit_code == 1
+        assert "Invalid IAM configuration" in result.output
+        steps.infra.assert_not_called()
+
+    def test_unexpected_error_becomes_click_error(self, context, workdir, steps):
+        """Unexpected exceptions should exit with a ClickException message."""
+        steps.infra.side_effect = RuntimeError("quota exceeded")
+
+        result = _invoke(context)
+
+        assert result.exit_code == 1
+        assert "Error: quota exceeded" in result.output
+        assert (workdir / "my-infra-iam-config.json").exists()
+
+
+class TestSerializeConfig:
+    """Tests for _serialize_config helper."""
+
+    def test_indented_and_compact_output(self):
+        """Configs should serialize indented by default and compact on request."""
+        assert _serialize_config({"a": [1, 2]}) == b'{\n  "a": [\n    1,\n    2\n  ]\n}'
+        assert _serialize_config({"a": [1, 2]}, compact=True) == b'{"a":[1,2]}'
+
+
+class TestCreateInfraReuseKeys:
+    """Tests for infra create --reuse-keys."""
+
+    def test_reuses_matching_keypair(self, context, workdir, keypair):
+        """A matching key and JWKS should be reused without generating keys."""
+        (workdir / "my-infra-signing-key.pem").write_text(keypair.private_key_pem)
+        (workdir / "my-infra-jwks.json").write_text(keypair.jwks_json)
+
+        with patch(
+            "gcphcp.cli.commands.infra.generate_cluster_keypair"
+        ) as mock_generate, patch(
+            "gcphcp.cli.commands.infra.create_iam_gcp", return_value=_IAM_CONFIG
+        ) as mock_iam, patch(
+            "gcphcp.cli.commands.infra.create_infra_gcp", return_value=_INFRA_CONFIG
+        ):
+            result = CliRunner().invoke(
+                create_infra,
+                ["my-infra", "--project", "my-project", "--reuse-keys"],
+                obj=context,
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_generate.assert_not_called()
+        assert mock_iam.call_args.kwargs["oidc_jwks_file"] == "my-infra-jwks.json"
+        assert "Reusing existing keypair" in context.console.file.getvalue()
+
+    def test_rejects_mismatched_keypair(self, context, workdir, keypair):
+        """A JWKS for another key should stop the command before IAM setup."""
+        other = _make_keypair()
+        (workdir / "my-infra-signing-key.pem").write_text(keypair.private_key_pem)
+        (workdir / "my-infra-jwks.json").write_text(other.jwks_json)
+
+        with patch("gcphcp.cli.commands.infra.create_iam_gcp") as mock_iam, patch(
+            "gcphcp.cli.commands.infra.create_infra_gcp"
+        ) as mock_infra:
+            result = CliRunner().invoke(
+                create_infra,
+                ["my-infra", "--project", "my-project", "--reuse-keys"],
+                obj=context,
+            )
+
+        assert result.exit_code == 1
+        assert "does not contain the public key" in result.output
+        mock_iam.assert_not_called()
+        mock_infra.assert_not_called()
+
+
+class TestWriteFileAtomic:
+    """Tests for _write_file_atomic helper."""
+
+    def test_replaces_stale_temp_file_with_private_mode(self, tmp_path):
+        """A leftover world-readable temp file must not become the key file."""
+        path = tmp_path / "signing-key.pem"
+        stale = tmp_path / "signing-key.pem.tmp"
+        stale.write_text("stale")
+        os.chmod(stale, 0o644)
+
+        _write_file_atomic(str(path), b"secret", mode=0o600)
+
+        assert path.read_bytes() == b"secret"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert not stale.exists()
@@ -1,10 +1,21 @@
 """Unit tests for nodepool commands."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from click import ClickException
+from click.testing import CliRunner
 
-from gcphcp.cli.commands.nodepools import resolve_nodepool_identifier
+from gcphcp.client.exceptions import APIError, ValidationError
+from gcphcp.cli.commands._common import resolved_nodepools
+from gcphcp.cli.commands.nodepools import (
+    scale_nodepool,
+    create_nodepool,
+    list_nodepools,
+    nodepool_status,
+    parse_labels,
+    parse_taints,
+    resolve_nodepool_identifier,
+)
 
 
 class TestResolveNodepoolIdentifier:
@@ -32,7 +43,7 @@ class TestResolveNodepoolIdentifier:
 
         assert result == "abc12345-1234-1234-1234-123456789abc"
         mock_api_client.get.assert_called_once_with(
-            "/api/v1/nodepools", params={"limit": 100}
+            "/api/v1/nodepools", params={"limit": 100, "offset": 0}
         )
 
     def test_ambiguous_nodepool_name_raises_error(self, mock_api_client):
@@ -91,7 +102,8 @@ class TestResolveNodepoolIdentifier:
 
         assert result == "abc12345-1111-1111-1111-111111111111"
         mock_api_client.get.assert_called_once_with(
-            "/api/v1/nodepools", params={"limit": 100, "clusterId": "cluster-1"}
+            "/api/v1/nodepools",
+            params={"limit": 100, "offset": 0, "clusterId": "cluster-1"},
         )
 
     def test_full_uuid_resolves_directly(self, mock_api_client):
@@ -181,3 +193,257 @@ class TestResolveNodepoolIdentifier:
 
         error_message = str(exc_info.value)
         assert "No nodepool found" in error_message
+
+    def test_name_beyond_first_page_resolves(self, mock_api_client):
+        """Test that nodepools past the first page of 100 are searched."""
+        first_page = [
+            {"id": f"{i:08x}-0000-0000-0000-000000000000", "name": f"np-{i}"}
+            for i in range(100)
+        ]
+        second_page = [
+            {"id": "abc12345-1234-1234-1234-123456789abc", "name": "my-nodepool"}
+        ]
+        mock_api_client.get.side_effect = [
+            {"nodepools": first_page, "total": 101},
+            {"nodepools": second_page, "total": 101},
+        ]
+
+        result = resolve_nodepool_identifier(mock_api_client, "my-nodepool")
+
+        assert result == "abc12345-1234-1234-1234-123456789abc"
+        assert mock_api_client.get.call_args_list[1].kwargs["params"] == {
+            "limit": 100,
+            "offset": 100,
+        }
+
+    def test_uuid_detail_is_kept_for_one_reuse(self, mock_api_client):
+        """Test that the nodepool fetched by full UUID is reused once."""
+        nodepool_id = "abc12345-1234-1234-1234-123456789abc"
+        nodepool = {"id": nodepool_id, "name": "my-nodepool", "spec": {}}
+        mock_api_client.get.return_value = nodepool
+
+        assert resolve_nodepool_identifier(mock_api_client, nodepool_id) == (
+            nodepool_id
+        )
+        assert resolved_nodepools.take(mock_api_client, nodepool_id) == nodepool
+        assert resolved_nodepools.take(mock_api_client, nodepool_id) is None
+
+    def test_list_entry_is_not_kept(self, mock_api_client):
+        """Test that a nodepool found in the list page is not reused."""
+        nodepool = {
+            "id": "abc12345-1234-1234-1234-123456789abc",
+            "name": "my-nodepool",
+            "cluster_id": "cluster-1",
+        }
+        mock_api_client.get.return_value = {"nodepools": [nodepool]}
+
+        nodepool_id = resolve_nodepool_identifier(mock_api_client, "my-nodepool")
+
+        assert resolved_nodepools.take(mock_api_client, nodepool_id) is None
+
+    def test_uuid_shaped_non_hex_skips_direct_get(self, mock_api_client):
+        """Test that a 36-char non-UUID identifier is not fetched directly."""
+        name = "workerss-pool-east-zone-nodesxxxxxxx"
+        assert len(name) == 36 and name.count("-") == 4
+        mock_api_client.get.return_value = {
+            "nodepools": [{"id": "abc12345-1234-1234-1234-123456789abc", "name": name}]
+        }
+
+        result = resolve_nodepool_identifier(mock_api_client, name)
+
+        assert result == "abc12345-1234-1234-1234-123456789abc"
+        mock_api_client.get.assert_called_once_with(
+            "/api/v1/nodepools", params={"limit": 100, "offset": 0}
+        )
+
+
+class TestParseLabelsAndTaints:
+    """Test cases for parse_labels and parse_taints."""
+
+    def test_labels_split_at_first_equals(self):
+        """Test that label values may contain '=' and are stripped."""
+        assert parse_labels(("env=prod", " team = a=b ")) == {
+            "env": "prod",
+            "team": "a=b",
+        }
+
+    def test_taints_split_at_last_colon(self):
+        """Test that taint effects come after the last ':'."""
+        assert parse_taints(("gpu=true:NoSchedule", "k=a:b:NoExecute")) == [
+            {"key": "gpu", "value": "true", "effect": "NoSchedule"},
+            {"key": "k", "value": "a:b", "effect": "NoExecute"},
+        ]
+
+    @pytest.mark.parametrize("taint", ["gpu", "gpu=true", "gpu:NoSchedule", "a:b=c"])
+    def test_invalid_taint_raises_error(self, taint):
+        """Test that malformed taints are rejected."""
+        with pytest.raises(ClickException, match="Invalid taint format"):
+            parse_taints((taint,))
+
+    def test_invalid_label_raises_error(self):
+        """Test that labels without '=' are rejected."""
+        with pytest.raises(ClickException, match="Invalid label format"):
+            parse_labels(("env",))
+
+
+class TestListNodepools:
+    """Test cases for nodepools list."""
+
+    def test_cluster_fetched_by_uuid_lookup_is_not_fetched_again(self):
+        """Test that --cluster <uuid> fetches the cluster only once."""
+        cluster_id = "0c1a2b3d-1234-1234-1234-123456789abc"
+        context = MagicMock()
+        context.output_format = "table"
+        api_client = context.get_api_client.return_value
+
+        def fake_get(path, params=None):
+            if path == "/api/v1/nodepools":
+                return {
+                    "nodepools": [
+                        {
+                            "id": "abc12345-1234-1234-1234-123456789abc",
+                            "name": "workers",
+                            "clusterId": cluster_id,
+                        }
+                    ]
+                }
+            return {"id": cluster_id, "name": "demo", "targetProjectId": "proj"}
+
+        api_client.get.side_effect = fake_get
+
+        result = CliRunner().invoke(
+            list_nodepools, ["--cluster", cluster_id], obj=context
+        )
+
+        assert result.exit_code == 0, result.output
+        cluster_gets = [
+            c for c in api_client.get.call_args_list if c.args[0].endswith(cluster_id)
+        ]
+        assert len(cluster_gets) == 1
+        api_client.get.assert_any_call(
+            "/api/v1/nodepools", params={"limit": 50, "clusterId": cluster_id}
+        )
+        assert len(api_client.get.call_args_list) == 2
+        (rows,) = context.formatter.print_table_rows.call_args.args
+        assert list(rows) == [
+            (
+                "workers",
+                "abc12345-1234-1234-1234-123456789abc",
+                "Unknown",
+                "demo",
+                "proj",
+                context.formatter.format_datetime.return_value,
+            )
+        ]
+
+    def test_api_error_is_reported_as_click_error(self):
+        """Test that API failures are printed and end the command."""
+        context = MagicMock()
+        context.get_api_client.return_value.get.side_effect = APIError("boom")
+
+        result = CliRunner().invoke(list_nodepools, [], obj=context)
+
+        assert result.exit_code == 1
+        assert "boom" in result.output
+        context.console.print.assert_called_once_with("[red]API error: boom[/red]")
+
+    def test_rejected_request_is_reported_as_api_error(self):
+        """Test that list keeps reporting 400 responses as API errors."""
+        context = MagicMock()
+        context.get_api_client.return_value.get.side_effect = ValidationError("bad")
+
+        result = CliRunner().invoke(list_nodepools, [], obj=context)
+
+        assert result.exit_code == 1
+        context.console.print.assert_called_once_with("[red]API error: bad[/red]")
+
+
+class TestCreateNodepool:
+    """Test cases for nodepools create command."""
+
+    def test_rejected_request_is_reported_as_validation_error(self):
+        """Test that create reports 400 responses as validation errors."""
+        cluster_id = "abc12345-1234-1234-1234-123456789abc"
+        context = MagicMock()
+        context.quiet = True
+        api_client = context.get_api_client.return_value
+        api_client.get.return_value = {"id": cluster_id, "name": "demo"}
+        api_client.post.side_effect = ValidationError("bad replicas")
+
+        result = CliRunner().invoke(
+            create_nodepool,
+            ["workers", "--cluster", cluster_id, "--replicas", "2"],
+            obj=context,
+        )
+
+        assert result.exit_code == 1
+        context.console.print.assert_any_call(
+            "[red]Validation error: bad replicas[/red]"
+        )
+
+
+class TestScaleNodepool:
+    """Test cases for nodepools scale command."""
+
+    def test_update_is_built_from_the_detail_resource(self):
+        """Test that a name lookup still fetches the full spec before the PUT."""
+        nodepool_id = "abc12345-1234-1234-1234-123456789abc"
+        summary = {"id": nodepool_id, "name": "workers", "spec": {"replicas": 1}}
+        detail = {
+            "id": nodepool_id,
+            "name": "workers",
+            "spec": {"replicas": 1, "platform": {"gcp": {"instanceType": "n2"}}},
+        }
+        context = MagicMock()
+        context.quiet = True
+        api_client = context.get_api_client.return_value
+        api_client.get.side_effect = lambda path, **_: (
+            detail
+            if path == f"/api/v1/nodepools/{nodepool_id}"
+            else {"nodepools": [summary]}
+        )
+
+        result = CliRunner().invoke(
+            scale_nodepool, ["workers", "--replicas", "3"], obj=context
+        )
+
+        assert result.exit_code == 0, result.output
+        api_client.put.assert_called_once_with(
+            f"/api/v1/nodepools/{nodepool_id}",
+            json_data={"spec": {**detail["spec"], "replicas": 3}},
+        )
+
+
+class TestNodepoolStatusWatch:
+    """Test cases for nodepools status --watch polling."""
+
+    def test_redraws_only_when_status_changes(self):
+        """Test that unchanged polls do not repaint the status."""
+        nodepool_id = "abc12345-1234-1234-1234-123456789abc"
+        phases = iter(["Provisioning", "Provisioning", "Ready", "Ready"])
+        context = MagicMock()
+        context.output_format = "table"
+        api_client = context.get_api_client.return_value
+
+        def fake_get(path, params=None, conditional=False):
+            if path.endswith("/status"):
+                assert conditional
+                return {"status": {"phase": next(phases)}}
+            return {"id": nodepool_id, "name": "workers"}
+
+        api_client.get.side_effect = fake_get
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 4:
+                raise KeyboardInterrupt
+
+        with patch("time.sleep", side_effect=fake_sleep):
+            result = CliRunner().invoke(
+                nodepool_status, [nodepool_id, "--watch"], obj=context
+            )
+
+        assert result.exit_code == 0, result.output
+        assert len(sleeps) == 4
+        assert context.formatter.print_nodepool_status.call_count == 2